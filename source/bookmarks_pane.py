@@ -8,6 +8,13 @@ from PySide6.QtGui import QAction, QKeySequence, QFont, QColor, QBrush, QIcon
 
 from model import BookmarkItem
 
+def _icon_path(filename):
+    """Path of an icon shipped alongside this module (or the compiled executable)."""
+    if "__compiled__" in globals():
+        import sys
+        return os.path.join(os.path.dirname(sys.executable), "source", filename)
+    return os.path.join(os.path.dirname(__file__), filename)
+
 class PageDelegate(QStyledItemDelegate):
     def displayText(self, value, locale):
         text = str(value)
@@ -156,6 +163,11 @@ class BookmarksPane(QWidget):
     def __init__(self, viewmodel, parent=None):
         super().__init__(parent)
         self.vm = viewmodel
+
+        # Shared by every bookmark item; built once instead of per item on each repopulate
+        self._bookmark_icon = QIcon(_icon_path("bookmark.svg"))
+        self._bookmark_linked_icon = QIcon(_icon_path("bookmark_linked.svg"))
+
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
         
@@ -297,6 +309,8 @@ class BookmarksPane(QWidget):
 
     def _populate_tree(self):
         self._is_populating = True
+        # Suspend repaints too, so clear/insert/expandAll/restyle land as one frame
+        self.tree.setUpdatesEnabled(False)
         self.tree.blockSignals(True)
         try:
             self.tree.clear()
@@ -307,6 +321,7 @@ class BookmarksPane(QWidget):
                 
             # Create a root node for each PDF
             pdf_root_nodes = {}
+            faint_brush = QBrush(QColor(150, 150, 150))
             for pdf in pdf_list:
                 root_item = QTreeWidgetItem([pdf.name, ""])
                 
@@ -314,8 +329,6 @@ class BookmarksPane(QWidget):
                 font = root_item.font(0)
                 font.setBold(True)
                 root_item.setFont(0, font)
-                
-                faint_brush = QBrush(QColor(150, 150, 150))
                 root_item.setForeground(0, faint_brush)
                 
                 # Remove editable flag
@@ -326,8 +339,8 @@ class BookmarksPane(QWidget):
                 
                 root_item.setData(0, Qt.ItemDataRole.UserRole, pdf) # Store PDF directly
                 
-                self.tree.addTopLevelItem(root_item)
-                root_item.setExpanded(True)
+                # Roots stay detached until every bookmark is attached, so the
+                # tree's model sees one insertion instead of one per item.
                 pdf_root_nodes[id(pdf)] = root_item
                 
             # Insert bookmarks
@@ -340,15 +353,7 @@ class BookmarksPane(QWidget):
                 root_item = pdf_root_nodes[id(pdf)]
                 
                 item = QTreeWidgetItem([bm.title, str(bm.page)])
-                if "__compiled__" in globals():
-                    import sys
-                    bookmark_icon_path = os.path.join(os.path.dirname(sys.executable), "source", "bookmark.svg")
-                    bookmark_linked_icon_path = os.path.join(os.path.dirname(sys.executable), "source", "bookmark_linked.svg")
-                else:
-                    bookmark_icon_path = os.path.join(os.path.dirname(__file__), "bookmark.svg")
-                    bookmark_linked_icon_path = os.path.join(os.path.dirname(__file__), "bookmark_linked.svg")
-                
-                item.setIcon(0, QIcon(bookmark_icon_path))
+                item.setIcon(0, self._bookmark_icon)
                 item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
                 item.setData(0, Qt.ItemDataRole.UserRole, bm)
                 
@@ -371,8 +376,9 @@ class BookmarksPane(QWidget):
                         else:
                             root_item.addChild(item)
                     last_item_at_level[level] = item
-                    
-                item.setExpanded(True)
+                
+            self.tree.addTopLevelItems(list(pdf_root_nodes.values()))
+            self.tree.expandAll()
                 
             # Re-run italics/tooltip check for all items now that the tree is fully built
             it = QTreeWidgetItemIterator(self.tree)
@@ -396,16 +402,11 @@ class BookmarksPane(QWidget):
                         tooltip = self.tr("Source: {0}").format(source_name)
                         item.setToolTip(0, tooltip)
                         item.setToolTip(1, tooltip)
-                        
-                        if "__compiled__" in globals():
-                            import sys
-                            bookmark_linked_icon_path = os.path.join(os.path.dirname(sys.executable), "source", "bookmark_linked.svg")
-                        else:
-                            bookmark_linked_icon_path = os.path.join(os.path.dirname(__file__), "bookmark_linked.svg")
-                        item.setIcon(0, QIcon(bookmark_linked_icon_path))
+                        item.setIcon(0, self._bookmark_linked_icon)
                 it += 1
         finally:
             self.tree.blockSignals(False)
+            self.tree.setUpdatesEnabled(True)
             self._is_populating = False
 
     def _on_item_changed(self, item, column):
@@ -424,74 +425,69 @@ class BookmarksPane(QWidget):
             old_state = self.vm.get_state()
             new_toc = []
             
-            def traverse(item, parent_pdf, level):
-                title = item.text(0).strip() or self.tr("Untitled")
-                
-                try:
-                    page = int(item.text(1))
-                    if page < 1: page = 1
-                except ValueError:
-                    page = 1
-                    
-                bm = item.data(0, Qt.ItemDataRole.UserRole)
-                if bm and isinstance(bm, BookmarkItem):
-                    bm.title = title
-                    bm.page = page
-                    bm.level = level
-                    if level == 1:
-                        # Top-level bookmarks must belong to the PDF container root they reside under
-                        bm.source_pdf = parent_pdf
-                    new_toc.append(bm)
-                    current_pdf = bm.source_pdf
-                else:
-                    # Newly created item inherits PDF from parent/ancestor
-                    bm = BookmarkItem(title=title, page=page, level=level, source_pdf=parent_pdf)
-                    item.setData(0, Qt.ItemDataRole.UserRole, bm)
-                    new_toc.append(bm)
-                    current_pdf = parent_pdf
+            def traverse(start_item, start_pdf, start_level):
+                # Explicit stack instead of recursion: deep outlines cannot hit the
+                # recursion limit. Children are pushed in reverse to keep pre-order.
+                stack = [(start_item, start_pdf, start_level)]
 
-                # Apply Guest bookmark visualization (italics + tooltip)
-                # Find the top-level PDF root this item is attached to
-                top_root = item
+                # Every item in this subtree shares the same top-level root, so
+                # resolve it once here rather than climbing parents per item.
+                top_root = start_item
                 while top_root.parent():
                     top_root = top_root.parent()
                 root_pdf = top_root.data(0, Qt.ItemDataRole.UserRole)
+
+                while stack:
+                    item, parent_pdf, level = stack.pop()
+                    title = item.text(0).strip() or self.tr("Untitled")
                 
-                if root_pdf != bm.source_pdf:
-                    italic_font = item.font(0)
-                    italic_font.setItalic(True)
-                    item.setFont(0, italic_font)
-                    item.setFont(1, italic_font)
-                    
-                    source_name = bm.source_pdf.name if bm.source_pdf else self.tr("Unknown")
-                    tooltip = self.tr("Source: {0}").format(source_name)
-                    item.setToolTip(0, tooltip)
-                    item.setToolTip(1, tooltip)
+                    try:
+                        page = int(item.text(1))
+                        if page < 1: page = 1
+                    except ValueError:
+                        page = 1
                     
-                    if "__compiled__" in globals():
-                        import sys
-                        bookmark_linked_icon_path = os.path.join(os.path.dirname(sys.executable), "source", "bookmark_linked.svg")
+                    bm = item.data(0, Qt.ItemDataRole.UserRole)
+                    if bm and isinstance(bm, BookmarkItem):
+                        bm.title = title
+                        bm.page = page
+                        bm.level = level
+                        if level == 1:
+                            # Top-level bookmarks must belong to the PDF container root they reside under
+                            bm.source_pdf = parent_pdf
+                        new_toc.append(bm)
+                        current_pdf = bm.source_pdf
                     else:
-                        bookmark_linked_icon_path = os.path.join(os.path.dirname(__file__), "bookmark_linked.svg")
-                    item.setIcon(0, QIcon(bookmark_linked_icon_path))
-                else:
-                    # Revert to normal if it's no longer a guest
-                    normal_font = item.font(0)
-                    normal_font.setItalic(False)
-                    item.setFont(0, normal_font)
-                    item.setFont(1, normal_font)
-                    item.setToolTip(0, "")
-                    item.setToolTip(1, "")
+                        # Newly created item inherits PDF from parent/ancestor
+                        bm = BookmarkItem(title=title, page=page, level=level, source_pdf=parent_pdf)
+                        item.setData(0, Qt.ItemDataRole.UserRole, bm)
+                        new_toc.append(bm)
+                        current_pdf = parent_pdf
+
+                    # Apply Guest bookmark visualization (italics + tooltip)
+                    if root_pdf != bm.source_pdf:
+                        italic_font = item.font(0)
+                        italic_font.setItalic(True)
+                        item.setFont(0, italic_font)
+                        item.setFont(1, italic_font)
                     
-                    if "__compiled__" in globals():
-                        import sys
-                        bookmark_icon_path = os.path.join(os.path.dirname(sys.executable), "source", "bookmark.svg")
+                        source_name = bm.source_pdf.name if bm.source_pdf else self.tr("Unknown")
+                        tooltip = self.tr("Source: {0}").format(source_name)
+                        item.setToolTip(0, tooltip)
+                        item.setToolTip(1, tooltip)
+                        item.setIcon(0, self._bookmark_linked_icon)
                     else:
-                        bookmark_icon_path = os.path.join(os.path.dirname(__file__), "bookmark.svg")
-                    item.setIcon(0, QIcon(bookmark_icon_path))
+                        # Revert to normal if it's no longer a guest
+                        normal_font = item.font(0)
+                        normal_font.setItalic(False)
+                        item.setFont(0, normal_font)
+                        item.setFont(1, normal_font)
+                        item.setToolTip(0, "")
+                        item.setToolTip(1, "")
+                        item.setIcon(0, self._bookmark_icon)
                     
-                for i in range(item.childCount()):
-                    traverse(item.child(i), current_pdf, level + 1)
+                    for i in range(item.childCount() - 1, -1, -1):
+                        stack.append((item.child(i), current_pdf, level + 1))
                     
             current_container_pdf_root = None
             from model import PDFDocument, BookmarkItem
@@ -590,12 +586,7 @@ class BookmarksPane(QWidget):
     def _create_new_item(self, source_pdf):
         new_bm = BookmarkItem(title=self.tr("New Bookmark"), page=1, level=1, source_pdf=source_pdf)
         item = QTreeWidgetItem([new_bm.title, str(new_bm.page)])
-        if "__compiled__" in globals():
-            import sys
-            bookmark_icon_path = os.path.join(os.path.dirname(sys.executable), "source", "bookmark.svg")
-        else:
-            bookmark_icon_path = os.path.join(os.path.dirname(__file__), "bookmark.svg")
-        item.setIcon(0, QIcon(bookmark_icon_path))
+        item.setIcon(0, self._bookmark_icon)
         item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
         item.setData(0, Qt.ItemDataRole.UserRole, new_bm)
         return item
@@ -1,15 +1,58 @@
+import logging
 import os
 import fitz
-import traceback
-from typing import List, Tuple
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
 
 from PySide6.QtCore import QCoreApplication
 from model import PDFDocument, BookmarkItem
-from utils import check_fitz_toc_for_first_page, adjust_toc_pages_and_levels
 
-def merge_pdfs_engine(pdf_list: List[PDFDocument], output_path: str, global_toc: List[BookmarkItem] = None) -> Tuple[bool, str]:
+logger = logging.getLogger(__name__)
+
+# Number of source files read ahead of the one being merged. Bounds how many
+# files are held in memory at once.
+PREFETCH_DEPTH = 4
+
+# Files larger than this are not read into memory ahead of time; fitz opens
+# them by path and reads from disk as pages are copied, so a batch of large
+# scans costs at most one file's objects rather than PREFETCH_DEPTH whole files.
+PREFETCH_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _read_source_bytes(pdf_path: str):
+    """
+    Read a source PDF into memory so disk I/O overlaps with merging.
+    Returns None for files over PREFETCH_MAX_BYTES or on failure; the caller
+    then opens the path directly and reports whatever error fitz raises.
+    """
+    try:
+        with open(pdf_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size > PREFETCH_MAX_BYTES:
+                return None
+            return f.read()
+    except OSError:
+        return None
+
+
+def _unchanged_since_load(pdf_item: PDFDocument) -> bool:
+    """True if the file's mtime still matches the one recorded when it was added."""
+    try:
+        return datetime.fromtimestamp(os.stat(pdf_item.file_path).st_mtime) == pdf_item.modified_dt
+    except OSError:
+        return False
+
+
+def merge_pdfs_engine(
+    pdf_list: List[PDFDocument],
+    output_path: str,
+    global_toc: List[BookmarkItem] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> Tuple[bool, str]:
     """
     Core engine to merge PDF files.
+    progress_callback, if given, is called as (files_done, total) after each source file.
     Returns (success_bool, message).
     """
     if not pdf_list:
@@ -19,19 +62,60 @@ def merge_pdfs_engine(pdf_list: List[PDFDocument], output_path: str, global_toc:
     final_toc = []
     current_page_offset = 0
     success_count = 0
+    # (name, reason) per skipped file; reason is None for a file without pages.
+    # Only the count is reported, so no message is formatted per failure.
     error_files = []
     pdf_offsets = {}
 
+    # A file listed more than once is opened once and kept until its last
+    # occurrence. Reusing the same source document, with final=False on all but
+    # its last insert, keeps insert_pdf's graft map alive so objects already
+    # imported are shared instead of copied again.
+    remaining_uses = Counter(pdf.file_path for pdf in pdf_list)
+    shared_docs = {}
+
+    # fitz is not thread-safe, so only the file reads run in the pool;
+    # parsing and page insertion stay on this thread, in list order.
+    executor = ThreadPoolExecutor(max_workers=PREFETCH_DEPTH)
+    read_paths = set()
+
+    def prefetch(pdf: PDFDocument):
+        # A file read as having no pages is skipped without parsing it, unless
+        # it has been modified since. A count loaded from a project is not
+        # trusted until it has been verified. Skipped files and repeats of a
+        # file already read are not read again; a repeat reuses the open doc.
+        skip = pdf.pages == 0 and pdf.pages_verified and _unchanged_since_load(pdf)
+        if skip or pdf.file_path in read_paths:
+            return skip, None
+        read_paths.add(pdf.file_path)
+        return skip, executor.submit(_read_source_bytes, pdf.file_path)
+
+    prefetched = deque(prefetch(pdf) for pdf in pdf_list[:PREFETCH_DEPTH])
+
     try:
-        for pdf_item in pdf_list:
+        for index, pdf_item in enumerate(pdf_list):
             pdf_path = pdf_item.file_path
             name = pdf_item.name
             doc_to_add = None
+            remaining_uses[pdf_path] -= 1
+            skip, pending_read = prefetched.popleft()
+            source_bytes = pending_read.result() if pending_read is not None else None
+            if index + PREFETCH_DEPTH < len(pdf_list):
+                prefetched.append(prefetch(pdf_list[index + PREFETCH_DEPTH]))
             try:
-                doc_to_add = fitz.open(pdf_path)
+                if skip:
+                    error_files.append((name, None))
+                    continue
+
+                doc_to_add = shared_docs.pop(pdf_path, None)
+                if doc_to_add is None:
+                    if source_bytes is not None:
+                        doc_to_add = fitz.open(stream=source_bytes, filetype="pdf")
+                    else:
+                        doc_to_add = fitz.open(pdf_path)
                 num_pages_in_source = doc_to_add.page_count
                 if num_pages_in_source == 0:
-                    error_files.append(QCoreApplication.translate("engine", "{0} (no pages)").format(name))
+                    error_files.append((name, None))
                     doc_to_add.close()
                     continue
 
@@ -43,29 +127,43 @@ def merge_pdfs_engine(pdf_list: List[PDFDocument], output_path: str, global_toc:
                     from_page=0,
                     to_page=num_pages_in_source - 1,
                     start_at=current_page_offset,
+                    final=remaining_uses[pdf_path] == 0,
                 )
-                doc_to_add.close()
+                if remaining_uses[pdf_path] > 0:
+                    shared_docs[pdf_path] = doc_to_add
+                else:
+                    doc_to_add.close()
                 success_count += 1
                 current_page_offset += num_pages_in_source
 
             except Exception as process_error:
-                traceback.print_exc()
-                error_files.append(QCoreApplication.translate("engine", "{0} ({1})").format(name, type(process_error).__name__))
-                if doc_to_add and not getattr(doc_to_add, "is_closed", True):
+                # One line per failed file; a whole folder of bad PDFs should not
+                # format and print a full stack trace for each of them.
+                logger.warning("Error merging %s: %s", pdf_path, process_error)
+                error_files.append((name, type(process_error).__name__))
+                # Nothing closes the source before this point on a failed file
+                if doc_to_add is not None:
                     try:
                         doc_to_add.close()
-                    except:
+                    except Exception:
                         pass
+            finally:
+                if progress_callback is not None:
+                    progress_callback(index + 1, len(pdf_list))
 
         if success_count > 0:
             if global_toc:
+                # set_toc only reads the destination point, so one serves every entry
+                origin = fitz.Point(0, 0)
+                link_goto = fitz.LINK_GOTO
                 for bm in global_toc:
-                    if id(bm.source_pdf) in pdf_offsets:
-                        abs_page = pdf_offsets[id(bm.source_pdf)] + bm.page
+                    offset = pdf_offsets.get(id(bm.source_pdf))
+                    if offset is not None:
+                        abs_page = offset + bm.page
                         dest = {
-                            "kind": fitz.LINK_GOTO,
+                            "kind": link_goto,
                             "page": abs_page - 1,
-                            "to": fitz.Point(0, 0),
+                            "to": origin,
                             "zoom": 0.0,
                         }
                         final_toc.append([bm.level, bm.title, abs_page, dest])
@@ -73,17 +171,20 @@ def merge_pdfs_engine(pdf_list: List[PDFDocument], output_path: str, global_toc:
             if final_toc:
                 try:
                     merged_doc.set_toc(final_toc)
-                except Exception as e:
-                    traceback.print_exc()
+                except Exception:
+                    logger.exception("Error setting the merged outline")
 
             try:
-                merged_doc.save(output_path, garbage=4, deflate=True)
+                # use_objstms packs the many small page, outline and xref objects
+                # into compressed object streams; garbage=4 already removes
+                # duplicate objects.
+                merged_doc.save(output_path, garbage=4, deflate=True, use_objstms=True)
                 final_msg = QCoreApplication.translate("engine", "Merged {0} PDF(s) to {1}").format(success_count, output_path)
                 if error_files:
                     final_msg += " " + QCoreApplication.translate("engine", "({0} error(s)).").format(len(error_files))
                 return True, final_msg
             except Exception as save_error:
-                traceback.print_exc()
+                logger.exception("Error saving merged file %s", output_path)
                 return False, QCoreApplication.translate("engine", "ERROR saving merged file: {0}").format(save_error)
 
         elif error_files:
@@ -92,12 +193,17 @@ def merge_pdfs_engine(pdf_list: List[PDFDocument], output_path: str, global_toc:
             return False, QCoreApplication.translate("engine", "No valid PDFs were available to merge.")
 
     except Exception as merge_error:
-        traceback.print_exc()
+        logger.exception("Merge failed")
         return False, QCoreApplication.translate("engine", "FATAL Merge Error: {0}").format(merge_error)
     finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        for doc in shared_docs.values():
+            try:
+                doc.close()
+            except Exception:
+                pass
         if merged_doc is not None:
             try:
-                if not getattr(merged_doc, "is_closed", True):
-                    merged_doc.close()
+                merged_doc.close()
             except Exception:
                 pass
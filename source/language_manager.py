@@ -1,7 +1,10 @@
+import logging
 import os
 import sys
 from PySide6.QtCore import QObject, QTranslator, QCoreApplication, QSettings, Signal
 
+logger = logging.getLogger(__name__)
+
 class LanguageManager(QObject):
     language_changed = Signal(str)
 
@@ -50,10 +53,10 @@ class LanguageManager(QObject):
                 if self.translator.load(trans_path):
                     QCoreApplication.installTranslator(self.translator)
                 else:
-                    print(f"Failed to load translation: {trans_path}")
+                    logger.warning("Failed to load translation: %s", trans_path)
             else:
                 # If file doesn't exist, we just stay in English (or fallback)
-                print(f"Translation file not found: {trans_path}")
+                logger.debug("Translation file not found: %s", trans_path)
         
         self.current_lang = lang_code
         self.settings.setValue("language", lang_code)
@@ -2,7 +2,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional
 
-@dataclass
+# slots=True drops the per-instance __dict__; lists can hold thousands of these
+@dataclass(slots=True)
 class PDFDocument:
     file_path: str
     name: str
@@ -11,8 +12,9 @@ class PDFDocument:
     pages: int
     custom_toc: Optional[List] = field(default=None) # Kept for legacy project loading
     missing: bool = field(default=False)
+    pages_verified: bool = field(default=False) # pages was read from the file this session; not saved
 
-@dataclass
+@dataclass(slots=True)
 class BookmarkItem:
     title: str
     page: int
@@ -52,11 +52,12 @@ def save_project(
     # Serialize global_toc
     serialized_toc = []
     if global_toc is not None:
+        # Bookmarks hold references to entries of pdf_list; map them to indices
+        # once instead of a linear index() search per bookmark.
+        pdf_indices = {id(pdf): idx for idx, pdf in enumerate(pdf_list)}
         for bm in global_toc:
             # We reference the source_pdf by its index in the pdf_list
-            pdf_idx = -1
-            if bm.source_pdf in pdf_list:
-                pdf_idx = pdf_list.index(bm.source_pdf)
+            pdf_idx = pdf_indices.get(id(bm.source_pdf), -1)
             serialized_toc.append({
                 "title": bm.title,
                 "page": bm.page,
@@ -73,8 +74,11 @@ def save_project(
         "global_toc": serialized_toc,
     }
 
+    # json.dump() issues one write() per encoder chunk; serializing to a
+    # string first hands the whole file to a single write.
+    content = json.dumps(project_data, indent=2, ensure_ascii=False)
     with open(project_path, "w", encoding="utf-8") as f:
-        json.dump(project_data, f, indent=2, ensure_ascii=False)
+        f.write(content)
 
 
 def load_project(
@@ -106,10 +110,14 @@ def load_project(
         )
 
         modified_dt = _parse_datetime(entry.get("modified_dt", ""))
+        # Saved projects always carry the name; only derive it when absent
+        name = entry.get("name")
+        if name is None:
+            name = os.path.basename(resolved_path)
 
         pdf = PDFDocument(
             file_path=resolved_path,
-            name=entry.get("name", os.path.basename(resolved_path)),
+            name=name,
             size_kb=entry.get("size_kb", 0.0),
             modified_dt=modified_dt,
             pages=entry.get("pages", 0),
@@ -224,20 +232,30 @@ def refresh_pdf_metadata(pdf: PDFDocument) -> List[str]:
     changes: List[str] = []
     file_path = pdf.file_path
 
-    if not os.path.exists(file_path):
+    # A single stat both checks existence and provides size/mtime; a separate
+    # os.path.exists() would resolve the path a second time.
+    try:
+        file_stats = os.stat(file_path)
+    except OSError:
         if not pdf.missing:
             pdf.missing = True
             changes.append(QCoreApplication.translate("project_manager", "{0}: file no longer found").format(pdf.name))
         return changes
 
     try:
-        file_stats = os.stat(file_path)
         new_size_kb = file_stats.st_size / 1024.0
         new_modified_dt = datetime.fromtimestamp(file_stats.st_mtime)
 
-        doc = fitz.open(file_path)
-        new_pages = doc.page_count
-        doc.close()
+        # The page count cannot change without the size or mtime changing,
+        # so only parse the document when the stat result differs. A stored
+        # count of 0 may just be missing from the project file, so it is
+        # always re-read.
+        if pdf.pages > 0 and pdf.size_kb == new_size_kb and pdf.modified_dt == new_modified_dt:
+            new_pages = pdf.pages
+        else:
+            doc = fitz.open(file_path)
+            new_pages = doc.page_count
+            doc.close()
     except Exception as e:
         changes.append(QCoreApplication.translate("project_manager", "{0}: error reading file — {1}").format(pdf.name, e))
         return changes
@@ -255,6 +273,7 @@ def refresh_pdf_metadata(pdf: PDFDocument) -> List[str]:
     pdf.size_kb = new_size_kb
     pdf.modified_dt = new_modified_dt
     pdf.missing = False
+    pdf.pages_verified = True
 
     return changes
 
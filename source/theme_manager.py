@@ -1,9 +1,12 @@
+import logging
 import os
 import sys
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import QSettings, Qt, QObject
 from PySide6.QtGui import QPalette, QColor
 
+logger = logging.getLogger(__name__)
+
 class ThemeManager(QObject):
     def __init__(self, app: QApplication):
         super().__init__()
@@ -102,7 +105,7 @@ class ThemeManager(QObject):
                         self.app.setStyleSheet(f.read())
                     break
                 except Exception as e:
-                    print(f"Error loading stylesheet from {qss_path}: {e}")
+                    logger.warning("Error loading stylesheet from %s: %s", qss_path, e)
                 
         for window in self.app.topLevelWidgets():
             self.apply_window_theme(window)
@@ -1,13 +1,14 @@
 import fitz
 
+# Shared default destination point. set_toc only reads it, so one instance
+# serves every entry instead of allocating a Point per bookmark.
+_ORIGIN = fitz.Point(0, 0)
+
 def check_fitz_toc_for_first_page(toc):
     """Checks a PyMuPDF ToC list for an item pointing to page 1 (1-based index)."""
     if not toc:
         return False
-    for item in toc:
-        if len(item) >= 3 and isinstance(item[2], int) and item[2] == 1:
-            return True
-    return False
+    return any(len(item) >= 3 and isinstance(item[2], int) and item[2] == 1 for item in toc)
 
 def adjust_toc_pages_and_levels(toc, page_offset_0based, source_doc, level_increase=0):
     """
@@ -17,10 +18,15 @@ def adjust_toc_pages_and_levels(toc, page_offset_0based, source_doc, level_incre
     if not toc:
         return []
 
-    named_dest_dict = source_doc.resolve_names()
+    # resolve_names() walks the whole name tree, so it only runs once an
+    # entry actually uses a named destination.
+    named_dest_dict = None
     new_toc = []
+    # Bound once; looked up on every entry otherwise
+    link_named = fitz.LINK_NAMED
+    link_goto = fitz.LINK_GOTO
 
-    for i, item in enumerate(toc):
+    for item in toc:
         if not (isinstance(item, list) and len(item) >= 3):
             continue
 
@@ -49,8 +55,11 @@ def adjust_toc_pages_and_levels(toc, page_offset_0based, source_doc, level_incre
         # Destination Dictionary
         dest_dict = new_item[3] if len(new_item) > 3 and isinstance(new_item[3], dict) else {}
 
-        if dest_dict.get("kind") == fitz.LINK_NAMED:
+        kind = dest_dict.get("kind")
+        if kind == link_named:
             named = dest_dict.get("nameddest") or dest_dict.get("named")
+            if named and named_dest_dict is None:
+                named_dest_dict = source_doc.resolve_names()
             if named and named in named_dest_dict:
                 resolved_dest = named_dest_dict[named]
                 if resolved_dest and "page" in resolved_dest:
@@ -59,15 +68,12 @@ def adjust_toc_pages_and_levels(toc, page_offset_0based, source_doc, level_incre
                     if new_dest_page_0based < 0:
                         valid_entry = False
                     else:
-                        new_dest_dict = {
-                            "kind": fitz.LINK_GOTO,
-                            "page": new_dest_page_0based,
-                            "to": resolved_dest.get("to", fitz.Point(0, 0)),
-                            "zoom": resolved_dest.get("zoom", 0.0),
-                        }
-                        for key in resolved_dest:
-                            if key not in ["kind", "page", "to", "zoom"]:
-                                new_dest_dict[key] = resolved_dest[key]
+                        # Copy once and overwrite the core keys; extra keys carry over
+                        new_dest_dict = resolved_dest.copy()
+                        new_dest_dict["kind"] = link_goto
+                        new_dest_dict["page"] = new_dest_page_0based
+                        new_dest_dict["to"] = resolved_dest.get("to", _ORIGIN)
+                        new_dest_dict["zoom"] = resolved_dest.get("zoom", 0.0)
                         new_item[3] = new_dest_dict
                 else:
                     valid_entry = False
@@ -78,37 +84,28 @@ def adjust_toc_pages_and_levels(toc, page_offset_0based, source_doc, level_incre
                     if new_dest_page_0based < 0:
                         valid_entry = False
                     else:
-                        new_dest_dict = {
-                            "kind": fitz.LINK_GOTO,
-                            "page": new_dest_page_0based,
-                            "to": fitz.Point(0, 0),
-                            "zoom": dest_dict.get("zoom", 0.0),
-                        }
-                        for key in dest_dict:
-                            if key not in ["kind", "page", "to", "zoom"]:
-                                new_dest_dict[key] = dest_dict[key]
+                        new_dest_dict = dest_dict.copy()
+                        new_dest_dict["kind"] = link_goto
+                        new_dest_dict["page"] = new_dest_page_0based
+                        new_dest_dict["to"] = _ORIGIN
+                        new_dest_dict["zoom"] = dest_dict.get("zoom", 0.0)
                         new_item[3] = new_dest_dict
                 except ValueError:
                     valid_entry = False
             else:
                 valid_entry = False
 
-        elif dest_dict.get("kind") == fitz.LINK_GOTO:
+        elif kind == link_goto:
             original_page_0based = dest_dict.get("page", item[2] - 1)
             if isinstance(original_page_0based, int):
                 new_dest_page_0based = original_page_0based + page_offset_0based
                 if new_dest_page_0based < 0:
                     valid_entry = False
                 else:
-                    new_dest_dict = {
-                        "kind": fitz.LINK_GOTO,
-                        "page": new_dest_page_0based,
-                        "to": dest_dict.get("to", fitz.Point(0, 0)),
-                        "zoom": dest_dict.get("zoom", 0.0),
-                    }
-                    for key in dest_dict:
-                        if key not in ["kind", "page", "to", "zoom"]:
-                            new_dest_dict[key] = dest_dict[key]
+                    new_dest_dict = dest_dict.copy()
+                    new_dest_dict["page"] = new_dest_page_0based
+                    new_dest_dict["to"] = dest_dict.get("to", _ORIGIN)
+                    new_dest_dict["zoom"] = dest_dict.get("zoom", 0.0)
                     new_item[3] = new_dest_dict
             else:
                 valid_entry = False
@@ -121,9 +118,9 @@ def adjust_toc_pages_and_levels(toc, page_offset_0based, source_doc, level_incre
                 valid_entry = False
             else:
                 new_dest_dict = {
-                    "kind": fitz.LINK_GOTO,
+                    "kind": link_goto,
                     "page": new_dest_page_0based,
-                    "to": fitz.Point(0, 0),
+                    "to": _ORIGIN,
                     "zoom": 0.0,
                 }
                 if len(new_item) > 3:
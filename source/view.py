@@ -227,6 +227,13 @@ class MainWindow(QMainWindow):
         self.selection_timer.setInterval(200) # 200ms debounce
         self.selection_timer.timeout.connect(self._on_selection_timer_timeout)
 
+        # Coalesce rapid header clicks into a single sort
+        self._pending_sort = None
+        self.sort_timer = QTimer(self)
+        self.sort_timer.setSingleShot(True)
+        self.sort_timer.setInterval(50) # 50ms debounce
+        self.sort_timer.timeout.connect(self._on_sort_timer_timeout)
+
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
         self.layout = QVBoxLayout(self.central_widget)
@@ -279,6 +286,7 @@ class MainWindow(QMainWindow):
             
         if hasattr(self, 'add_btn'):
             self.add_btn.setText(self.tr(" Add PDFs"))
+            self.add_folder_btn.setText(self.tr(" Add Folder"))
             self.remove_btn.setText(self.tr(" Remove Selected"))
             
             preview_checked = self.toggle_preview_btn.isChecked()
@@ -409,6 +417,10 @@ class MainWindow(QMainWindow):
         
         self.pdf_table.setColumnWidth(2, 150)
         self.pdf_table.verticalHeader().setVisible(False)
+        # Uniform single-line rows: row heights never depend on content, and
+        # long names are elided instead of laid out for wrapping on every paint
+        self.pdf_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.pdf_table.setWordWrap(False)
         
         self._is_resizing_header = False
         header.sectionResized.connect(self._on_section_resized)
@@ -422,7 +434,9 @@ class MainWindow(QMainWindow):
         self.pdf_table.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
         self.pdf_table.setDragDropOverwriteMode(False)
         self.pdf_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.pdf_table.setSortingEnabled(True)
+        # Sorting is driven from the header so clicks can be debounced;
+        # QTableView.setSortingEnabled would call model.sort on every click.
+        header.sortIndicatorChanged.connect(self._on_sort_indicator_changed)
         self._clear_sort_indicator()
 
         self.delete_shortcut = QShortcut(QKeySequence(Qt.Key_Delete), self.pdf_table)
@@ -524,6 +538,9 @@ class MainWindow(QMainWindow):
         self.add_btn = QPushButton("")
         self.add_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon))
         
+        self.add_folder_btn = QPushButton("")
+        self.add_folder_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DirOpenIcon))
+        
         self.remove_btn = QPushButton("")
         self.remove_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_TrashIcon))
         
@@ -546,6 +563,7 @@ class MainWindow(QMainWindow):
         self.merge_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton))
         
         btn_layout.addWidget(self.add_btn)
+        btn_layout.addWidget(self.add_folder_btn)
         btn_layout.addWidget(self.remove_btn)
         btn_layout.addWidget(self.toggle_bookmarks_btn)
         btn_layout.addWidget(self.toggle_preview_btn)
@@ -612,6 +630,7 @@ class MainWindow(QMainWindow):
     def _bind_viewmodel(self):
         # View bindings (UI events to ViewModel methods)
         self.add_btn.clicked.connect(self.on_add_pdfs)
+        self.add_folder_btn.clicked.connect(self.on_add_folder)
         self.remove_btn.clicked.connect(self.on_remove_pdfs)
         self.merge_btn.clicked.connect(self.on_merge)
         self.output_dir_btn.clicked.connect(self.on_set_output_dir)
@@ -621,6 +640,7 @@ class MainWindow(QMainWindow):
         # ViewModel bindings (Signals to UI updates)
         self.vm.status_message.connect(self.on_status_message)
         self.vm.merge_started.connect(self.on_merge_started)
+        self.vm.merge_progress.connect(self.on_merge_progress)
         self.vm.merge_completed.connect(self.on_merge_completed)
         self.vm.output_dir_changed.connect(self.on_output_dir_changed)
         self.vm.thumbnail_started.connect(self.on_thumbnail_started)
@@ -649,11 +669,24 @@ class MainWindow(QMainWindow):
             header.setSortIndicatorShown(False)
         else:
             header.setSortIndicatorShown(True)
+            # Mirroring the model's state must not queue another sort
+            header.blockSignals(True)
             header.setSortIndicator(column, Qt.SortOrder(order))
+            header.blockSignals(False)
 
     def _clear_sort_indicator(self):
         self.pdf_table.horizontalHeader().setSortIndicatorShown(False)
 
+    def _on_sort_indicator_changed(self, column: int, order: Qt.SortOrder):
+        self._pending_sort = (column, order)
+        if not self.sort_timer.isActive():
+            self.sort_timer.start()
+
+    def _on_sort_timer_timeout(self):
+        pending, self._pending_sort = self._pending_sort, None
+        if pending is not None:
+            self.vm.pdf_list_model.sort(*pending)
+
     def _on_rows_inserted(self, parent, first, last):
         self._update_empty_state()
         if first == 0 and self.vm.pdf_list_model.rowCount() > 0:
@@ -674,16 +707,37 @@ class MainWindow(QMainWindow):
         if files:
             self.vm.set_last_open_dir(os.path.dirname(files[0]))
             self.add_btn.setEnabled(False) # Prevent multiple simultaneous loads
+            self.add_folder_btn.setEnabled(False)
             self.vm.add_pdfs(files)
 
+    def on_add_folder(self):
+        directory = QFileDialog.getExistingDirectory(
+            self, self.tr("Select Folder"), self.vm.last_open_dir
+        )
+        if directory:
+            self.vm.set_last_open_dir(directory)
+            self.add_btn.setEnabled(False)
+            self.add_folder_btn.setEnabled(False)
+            self.vm.add_pdf_directory(directory)
+
     def on_pdfs_added_finished(self, added: int, errors: int):
         self.add_btn.setEnabled(True)
+        self.add_folder_btn.setEnabled(True)
         self._update_empty_state()
 
+    def _selected_rows(self):
+        """Selected row numbers, read from the selection ranges.
+
+        Rows are selected whole, so each range maps straight to a run of rows
+        without wrapping one QModelIndex per selected row as selectedRows() does.
+        """
+        rows = []
+        for selection_range in self.pdf_table.selectionModel().selection():
+            rows.extend(range(selection_range.top(), selection_range.bottom() + 1))
+        return rows
+
     def on_remove_pdfs(self):
-        # We need to map the selected indices
-        indexes = self.pdf_table.selectionModel().selectedRows()
-        row_indices = [idx.row() for idx in indexes]
+        row_indices = self._selected_rows()
         if not row_indices:
             self.statusBar().showMessage(self.tr("No rows selected."), 3000)
             return
@@ -694,21 +748,21 @@ class MainWindow(QMainWindow):
 
     def _on_table_context_menu(self, position):
         """Show a context menu for the PDF table."""
-        indexes = self.pdf_table.selectionModel().selectedRows()
-        if not indexes:
+        rows = self._selected_rows()
+        if not rows:
             return
 
         menu = QMenu(self)
 
         # Refresh / Update PDF(s)
-        if len(indexes) == 1:
+        if len(rows) == 1:
             refresh_action = menu.addAction(self.tr("Update PDF from Disk"))
             refresh_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload))
             
             relocate_action = menu.addAction(self.tr("Relocate/Change PDF..."))
             relocate_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DirOpenIcon))
         else:
-            refresh_action = menu.addAction(self.tr("Update {0} PDFs from Disk").format(len(indexes)))
+            refresh_action = menu.addAction(self.tr("Update {0} PDFs from Disk").format(len(rows)))
             refresh_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload))
             relocate_action = None
 
@@ -717,10 +771,10 @@ class MainWindow(QMainWindow):
         menu.addSeparator()
 
         # Remove
-        if len(indexes) == 1:
+        if len(rows) == 1:
             remove_action = menu.addAction(self.tr("Remove"))
         else:
-            remove_action = menu.addAction(self.tr("Remove {0} PDFs").format(len(indexes)))
+            remove_action = menu.addAction(self.tr("Remove {0} PDFs").format(len(rows)))
         remove_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_TrashIcon))
 
         # Execute
@@ -729,9 +783,9 @@ class MainWindow(QMainWindow):
             return
 
         if action == refresh_action:
-            self._on_refresh_selected_pdfs(indexes)
+            self._on_refresh_selected_pdfs(rows)
         elif action == relocate_action:
-            self._on_change_pdf_path(indexes[0].row())
+            self._on_change_pdf_path(rows[0])
         elif action == remove_action:
             self.on_remove_pdfs()
 
@@ -756,26 +810,26 @@ class MainWindow(QMainWindow):
             if self.preview_pane.isVisible():
                 self.vm.request_thumbnails(new_path)
 
-    def _on_refresh_selected_pdfs(self, indexes):
+    def _on_refresh_selected_pdfs(self, rows):
         """Refresh metadata for the selected PDF(s) and report changes."""
+        from project_manager import refresh_pdf_metadata
         all_changes = []
-        for idx in indexes:
-            row = idx.row()
+        for row in rows:
             pdf = self.vm.pdf_list_model.pdfs[row]
-            from project_manager import refresh_pdf_metadata
             changes = refresh_pdf_metadata(pdf)
 
             # Invalidate thumbnail cache
             if pdf.file_path in self.vm.thumbnail_cache:
                 del self.vm.thumbnail_cache[pdf.file_path]
 
-            # Notify model
-            top_left = self.vm.pdf_list_model.index(row, 0)
-            bottom_right = self.vm.pdf_list_model.index(row, self.vm.pdf_list_model.columnCount() - 1)
-            self.vm.pdf_list_model.dataChanged.emit(top_left, bottom_right)
-
             all_changes.extend(changes)
 
+        # Notify the model once for the span covering every refreshed row
+        model = self.vm.pdf_list_model
+        model.dataChanged.emit(
+            model.index(min(rows), 0), model.index(max(rows), model.columnCount() - 1)
+        )
+
         if all_changes:
             QMessageBox.information(
                 self,
@@ -785,15 +839,14 @@ class MainWindow(QMainWindow):
                 + self.tr("\n\nCustom bookmarks have been preserved."),
             )
         else:
-            count = len(indexes)
+            count = len(rows)
             self.statusBar().showMessage(
                 self.tr("{0} PDF(s) checked — no changes detected.").format(count), 3000
             )
 
         # Refresh preview if visible
-        if self.preview_pane.isVisible() and len(indexes) == 1:
-            row = indexes[0].row()
-            pdf = self.vm.pdf_list_model.pdfs[row]
+        if self.preview_pane.isVisible() and len(rows) == 1:
+            pdf = self.vm.pdf_list_model.pdfs[rows[0]]
             if not pdf.missing:
                 self.vm.request_thumbnails(pdf.file_path)
 
@@ -834,14 +887,14 @@ class MainWindow(QMainWindow):
         self.selection_timer.start()
 
     def _on_selection_timer_timeout(self):
-        indexes = self.pdf_table.selectionModel().selectedRows()
+        selection = self.pdf_table.selectionModel().selection()
         
-        if not indexes:
+        if selection.isEmpty():
             self.preview_list.clear()
             return
             
         if self.preview_pane.isVisible():
-            row = indexes[0].row()
+            row = selection[0].top()
             pdf = self.vm.pdf_list_model.pdfs[row]
             if pdf.missing:
                 self.preview_list.clear()
@@ -898,10 +951,9 @@ class MainWindow(QMainWindow):
         self.toggle_preview_btn.setText(self.tr(" Hide Preview") if checked else self.tr(" Show Preview"))
         
         if checked:
-            indexes = self.pdf_table.selectionModel().selectedRows()
-            if indexes:
-                row = indexes[0].row()
-                pdf = self.vm.pdf_list_model.pdfs[row]
+            rows = self._selected_rows()
+            if rows:
+                pdf = self.vm.pdf_list_model.pdfs[rows[0]]
                 self.vm.request_thumbnails(pdf.file_path)
 
     def on_toggle_bookmarks(self, checked):
@@ -932,14 +984,25 @@ class MainWindow(QMainWindow):
 
     def on_merge_started(self):
         self.add_btn.setEnabled(False)
+        self.add_folder_btn.setEnabled(False)
         self.remove_btn.setEnabled(False)
         self.merge_btn.setEnabled(False)
         self.pdf_table.setEnabled(False)
         
+        self.progress_bar.setRange(0, 0)
         self.progress_bar.show()
 
+    def on_merge_progress(self, done: int, total: int):
+        if done < total:
+            self.progress_bar.setRange(0, total)
+            self.progress_bar.setValue(done)
+        else:
+            # All pages inserted; the save that follows has no measurable progress
+            self.progress_bar.setRange(0, 0)
+
     def on_merge_completed(self, success: bool, message: str):
         self.add_btn.setEnabled(True)
+        self.add_folder_btn.setEnabled(True)
         self.remove_btn.setEnabled(True)
         self.merge_btn.setEnabled(True)
         self.pdf_table.setEnabled(True)
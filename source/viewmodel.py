@@ -1,10 +1,16 @@
 import os
-from typing import List
+from typing import Dict, List
 from datetime import datetime
 import fitz
 import json
+import logging
+import time
 
 import copy
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 from PySide6.QtCore import (
     QObject,
     QAbstractTableModel,
@@ -21,6 +27,22 @@ from model import PDFDocument, BookmarkItem, ProjectState
 from engine import merge_pdfs_engine
 from project_manager import save_project, load_project, refresh_pdf_metadata, verify_all_pdf_metadata
 
+logger = logging.getLogger(__name__)
+
+def _contiguous_runs(rows_descending: List[int]):
+    """
+    Group descending, de-duplicated row numbers into (first, last) ranges,
+    highest range first, so they can be removed without shifting the rest.
+    """
+    runs = []
+    for r in rows_descending:
+        if runs and runs[-1][0] == r + 1:
+            runs[-1][0] = r
+        else:
+            runs.append([r, r])
+    return [(first, last) for first, last in runs]
+
+
 class ProjectStateCommand(QUndoCommand):
     def __init__(self, vm, old_state: ProjectState, new_state: ProjectState, description_key: str, context: str = "MainViewModel"):
         translated = QCoreApplication.translate(context, description_key)
@@ -41,11 +63,59 @@ class ProjectStateCommand(QUndoCommand):
             return
         self.vm._apply_state(self.new_state)
 
+@lru_cache(maxsize=256)
+def _read_pdf_metadata(file_path: str, mtime_ns: int, size: int):
+    """
+    Open a PDF and return (page_count, toc).
+    mtime_ns and size are part of the cache key so an entry is
+    invalidated as soon as the file changes on disk. Each entry holds the
+    file's whole outline, so the cache is kept small and is cleared when a
+    project is loaded.
+
+    Only [level, title, page] is needed from the outline, so the simple
+    form is used; it skips resolving every link destination and keeps
+    custom_toc JSON-serializable for project files.
+    """
+    doc = fitz.open(file_path)
+    try:
+        return doc.page_count, doc.get_toc(simple=True)
+    finally:
+        doc.close()
+
+
+@lru_cache(maxsize=4096)
+def _canonical_path(file_path: str) -> str:
+    """
+    os.path.realpath() memoized per path string. Every add canonicalizes the
+    whole current list for duplicate detection, and realpath lstat()s each
+    path component, so listed files are resolved once rather than on every add.
+    """
+    return os.path.realpath(file_path)
+
+
+def _stat_or_error(file_path):
+    """
+    os.stat() that returns the OSError instead of raising, for use with Executor.map.
+    Accepts an os.DirEntry too, whose stat() is served from the directory read on Windows.
+    """
+    try:
+        if isinstance(file_path, os.DirEntry):
+            return file_path.stat()
+        return os.stat(file_path)
+    except OSError as e:
+        return e
+
+
 class AddPDFWorker(QThread):
-    progress = Signal(PDFDocument)
+    progress = Signal(object) # Batch (list) of PDFDocument
     load_finished = Signal(int, int) # added, errors
     
-    def __init__(self, file_paths: List[str], existing_paths: set):
+    # Loaded PDFs are handed to the UI thread at most this often, so a large
+    # selection costs a handful of model inserts and bookmark pane rebuilds
+    # rather than one per file.
+    BATCH_INTERVAL = 0.2 # seconds
+
+    def __init__(self, file_paths: List, existing_paths: set):
         super().__init__()
         self.file_paths = file_paths
         self.existing_paths = existing_paths
@@ -57,49 +127,110 @@ class AddPDFWorker(QThread):
     def run(self):
         added_count = 0
         error_count = 0
-        for file_path in self.file_paths:
-            if self._is_cancelled:
-                break
-            if file_path in self.existing_paths:
-                continue
-            try:
-                file_stats = os.stat(file_path)
-                file_name = os.path.basename(file_path)
-                file_size_kb = file_stats.st_size / 1024.0
-                modified_dt = datetime.fromtimestamp(file_stats.st_mtime)
+        # Canonicalize each path once, up front: this catches relative/symlinked
+        # duplicates and repeats within the batch, and the loop below reuses it.
+        new_entries = []
+        for item in self.file_paths:
+            file_path = os.fspath(item)
+            real_path = _canonical_path(file_path)
+            if real_path not in self.existing_paths:
+                self.existing_paths.add(real_path)
+                new_entries.append((item, file_path, real_path))
+        if not new_entries:
+            self.load_finished.emit(added_count, error_count)
+            return
+
+        # os.stat releases the GIL, so the stats are issued concurrently (a win on
+        # network drives). PyMuPDF is not thread-safe, so parsing stays on this thread.
+        executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1, len(new_entries)))
+        batch = []
+        # The first loaded PDF is handed over at once so the table starts filling
+        # after one probe; later ones are batched by BATCH_INTERVAL.
+        last_emit = float("-inf")
+        try:
+            all_stats = executor.map(_stat_or_error, [item for item, _, _ in new_entries])
+            for (item, file_path, real_path), file_stats in zip(new_entries, all_stats):
+                if self._is_cancelled:
+                    break
+                try:
+                    if isinstance(file_stats, OSError):
+                        raise file_stats
+                    # A DirEntry already carries its name from the directory listing
+                    file_name = item.name if isinstance(item, os.DirEntry) else os.path.basename(file_path)
+                    file_size_kb = file_stats.st_size / 1024.0
+                    modified_dt = datetime.fromtimestamp(file_stats.st_mtime)
                 
-                doc = fitz.open(file_path)
-                pages = doc.page_count
-                toc = doc.get_toc(simple=False)
-                doc.close()
-
-                pdf = PDFDocument(
-                    file_path=file_path,
-                    name=file_name,
-                    size_kb=file_size_kb,
-                    modified_dt=modified_dt,
-                    pages=pages,
-                    custom_toc=toc
-                )
-                self.progress.emit(pdf)
-                added_count += 1
-            except Exception as e:
-                print(f"Error loading PDF metadata for {file_path}: {e}")
-                error_count += 1
+                    pages, toc = _read_pdf_metadata(
+                        real_path, file_stats.st_mtime_ns, file_stats.st_size
+                    )
+                    # The cached toc is shared between calls; hand out a private copy
+                    toc = [list(item) for item in toc]
+
+                    pdf = PDFDocument(
+                        file_path=file_path,
+                        name=file_name,
+                        size_kb=file_size_kb,
+                        modified_dt=modified_dt,
+                        pages=pages,
+                        custom_toc=toc,
+                        pages_verified=True
+                    )
+                    batch.append(pdf)
+                    added_count += 1
+                except Exception as e:
+                    logger.warning("Error loading PDF metadata for %s: %s", file_path, e)
+                    error_count += 1
+
+                if batch and time.monotonic() - last_emit >= self.BATCH_INTERVAL:
+                    self.progress.emit(batch)
+                    batch = []
+                    last_emit = time.monotonic()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        if batch:
+            self.progress.emit(batch)
         self.load_finished.emit(added_count, error_count)
 
 
+class VerifyMetadataWorker(QThread):
+    verified = Signal(object, object) # refreshed PDFDocument copies, change descriptions
+
+    def __init__(self, pdfs: List[PDFDocument]):
+        super().__init__()
+        # Refresh copies so the UI thread never reads a half-updated record;
+        # the results are copied onto the live records on the UI thread.
+        self.pdfs = [copy.copy(pdf) for pdf in pdfs]
+
+    def run(self):
+        changes = verify_all_pdf_metadata(self.pdfs)
+        self.verified.emit(self.pdfs, changes)
+
+
 class MergeWorker(QThread):
     merge_finished = Signal(bool, str)
+    progress = Signal(int, int) # files done, total
+
+    # Progress is forwarded to the UI thread at most this often; the last
+    # file is always reported.
+    PROGRESS_INTERVAL = 0.1 # seconds
 
     def __init__(self, pdf_list: List[PDFDocument], output_path: str, global_toc: List[BookmarkItem]):
         super().__init__()
         self.pdf_list = pdf_list
         self.output_path = output_path
         self.global_toc = global_toc
+        self._last_progress = 0.0
+
+    def _report_progress(self, done: int, total: int):
+        now = time.monotonic()
+        if done == total or now - self._last_progress >= self.PROGRESS_INTERVAL:
+            self._last_progress = now
+            self.progress.emit(done, total)
 
     def run(self):
-        success, message = merge_pdfs_engine(self.pdf_list, self.output_path, self.global_toc)
+        success, message = merge_pdfs_engine(
+            self.pdf_list, self.output_path, self.global_toc, self._report_progress
+        )
         self.merge_finished.emit(success, message)
 
 
@@ -134,7 +265,9 @@ class ThumbnailWorker(QThread):
                 mat = fitz.Matrix(zoom, zoom)
                 pix = page.get_pixmap(matrix=mat, alpha=False)
                 
-                img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
+                # samples_mv views the pixmap buffer directly; pix.samples would
+                # copy it to bytes first, only for QImage.copy() to copy it again
+                img = QImage(pix.samples_mv, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
                 img = img.copy()
                 
                 # Draw a thin border around the thumbnail
@@ -158,11 +291,58 @@ class ThumbnailWorker(QThread):
                 self.thumbnail_ready.emit(self.file_path, -1, batch)
             doc.close()
         except Exception as e:
-            print(f"Error generating thumbnails for {self.file_path}: {e}")
+            logger.warning("Error generating thumbnails for %s: %s", self.file_path, e)
+
+
+
 
 
+# Display strings are memoized on the underlying values, so repaints after a
+# sort, move or scroll reuse them, and a refreshed PDF simply misses the cache.
+@lru_cache(maxsize=4096)
+def _format_size_kb(size_kb: float) -> str:
+    return f"{size_kb:.1f}"
 
 
+@lru_cache(maxsize=4096)
+def _format_modified(modified_dt: datetime) -> str:
+    return modified_dt.strftime("%Y-%m-%d %H:%M")
+
+
+@lru_cache(maxsize=4096)
+def _format_modified_long(modified_dt: datetime) -> str:
+    # Extend the cached short form instead of running a second strftime
+    return f"{_format_modified(modified_dt)}:{modified_dt.second:02d}"
+
+
+# Per-column accessors for PDFListViewModel, indexed by column number.
+# Cells are formatted on demand by data(), so only visible rows pay for it.
+_DISPLAY_FORMATTERS = (
+    lambda pdf: pdf.name,
+    lambda pdf: _format_size_kb(pdf.size_kb),
+    lambda pdf: _format_modified(pdf.modified_dt),
+    lambda pdf: str(pdf.pages),
+)
+
+_TOOLTIP_FORMATTERS = (
+    lambda pdf: f"Path: {pdf.file_path}\nName: {pdf.name}",
+    lambda pdf: f"{pdf.size_kb:.3f} KB",
+    lambda pdf: _format_modified_long(pdf.modified_dt),
+    lambda pdf: f"{pdf.pages} pages",
+)
+
+# attrgetter runs in C; list.sort() calls the key once per row, so the
+# name column's lower() needs no precomputed field.
+_SORT_KEYS = (
+    lambda pdf: pdf.name.lower(),
+    attrgetter("size_kb"),
+    attrgetter("modified_dt"),
+    attrgetter("pages"),
+)
+
+# Flags shared by every valid cell of the PDF table.
+_ROW_FLAGS = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsDragEnabled
+
 
 class PDFListViewModel(QAbstractTableModel):
     order_broken = Signal()
@@ -172,13 +352,15 @@ class PDFListViewModel(QAbstractTableModel):
         self.pdfs: List[PDFDocument] = []
         self.headers = ["Name", "Size (KB)", "Modified Date", "Pages"]
         self.dragged_rows = []
+        self.main_vm = None # Set by MainViewModel
+        self._old_state_for_drag = None
 
     def mimeTypes(self):
         return ["application/x-qabstractitemmodeldatalist"]
 
     def mimeData(self, indexes):
         self._old_state_for_drag = None
-        if hasattr(self, 'main_vm') and self.main_vm:
+        if self.main_vm:
             self._old_state_for_drag = self.main_vm.get_state()
         self.dragged_rows = sorted(list(set(index.row() for index in indexes)))
         return super().mimeData(indexes)
@@ -197,28 +379,27 @@ class PDFListViewModel(QAbstractTableModel):
         else:
             begin_row = self.rowCount(QModelIndex())
             
-        if not hasattr(self, 'dragged_rows') or not self.dragged_rows:
+        if not self.dragged_rows:
             return False
             
-        if hasattr(self, 'main_vm') and self.main_vm:
+        if self.main_vm:
             self.main_vm.sort_column = -1
         self.order_broken.emit()
         self.layoutAboutToBeChanged.emit()
         
         moved_items = [self.pdfs[r] for r in self.dragged_rows]
-        
-        insert_row = begin_row
-        for r in self.dragged_rows:
-            if r < begin_row:
-                insert_row -= 1
-                
-        for r in sorted(self.dragged_rows, reverse=True):
-            self.pdfs.pop(r)
-            
-        for i, item in enumerate(moved_items):
-            self.pdfs.insert(insert_row + i, item)
+        insert_row = begin_row - sum(1 for r in self.dragged_rows if r < begin_row)
+
+        # Rebuild the order in one pass rather than a pop() and insert() per
+        # dragged row, each of which shifts the tail of the list.
+        dragged = set(self.dragged_rows)
+        original_order = list(self.pdfs)
+        remaining = [pdf for i, pdf in enumerate(original_order) if i not in dragged]
+        remaining[insert_row:insert_row] = moved_items
+        self.pdfs[:] = remaining
+        self._follow_moved_rows(original_order)
             
-        if hasattr(self, 'main_vm') and self.main_vm and self._old_state_for_drag:
+        if self.main_vm and self._old_state_for_drag:
             self.main_vm.commit_state("Reorder PDFs", self._old_state_for_drag, "PDFListViewModel")
             
         self.dragged_rows = []
@@ -238,16 +419,11 @@ class PDFListViewModel(QAbstractTableModel):
 
         pdf = self.pdfs[index.row()]
         col = index.column()
+        if not (0 <= col < len(_SORT_KEYS)):
+            return None
 
         if role == Qt.ItemDataRole.DisplayRole:
-            if col == 0:
-                return pdf.name
-            elif col == 1:
-                return f"{pdf.size_kb:.1f}"
-            elif col == 2:
-                return pdf.modified_dt.strftime("%Y-%m-%d %H:%M")
-            elif col == 3:
-                return str(pdf.pages)
+            return _DISPLAY_FORMATTERS[col](pdf)
 
         elif role == Qt.ItemDataRole.ForegroundRole:
             if pdf.missing:
@@ -257,25 +433,11 @@ class PDFListViewModel(QAbstractTableModel):
         elif role == Qt.ItemDataRole.ToolTipRole:
             if pdf.missing:
                 return QCoreApplication.translate("PDFListViewModel", "FILE NOT FOUND\nPath: {0}").format(pdf.file_path)
-            if col == 0:
-                return f"Path: {pdf.file_path}\nName: {pdf.name}"
-            elif col == 1:
-                return f"{pdf.size_kb:.3f} KB"
-            elif col == 2:
-                return f"{pdf.modified_dt:%Y-%m-%d %H:%M:%S}"
-            elif col == 3:
-                return f"{pdf.pages} pages"
+            return _TOOLTIP_FORMATTERS[col](pdf)
 
         elif role == Qt.ItemDataRole.UserRole:
             # Allow custom sorting based on UserRole
-            if col == 0:
-                return pdf.name.lower()
-            elif col == 1:
-                return pdf.size_kb
-            elif col == 2:
-                return pdf.modified_dt
-            elif col == 3:
-                return pdf.pages
+            return _SORT_KEYS[col](pdf)
 
         return None
 
@@ -292,47 +454,78 @@ class PDFListViewModel(QAbstractTableModel):
         reverse = (order == Qt.SortOrder.DescendingOrder)
         
         old_state = None
-        if hasattr(self, 'main_vm') and self.main_vm:
+        if self.main_vm:
             old_state = self.main_vm.get_state()
             self.main_vm.sort_column = column
             self.main_vm.sort_order = order
             self.main_vm.sort_state_changed.emit(column, order.value)
 
         original_order = list(self.pdfs)
-        
-        def sort_key(pdf):
-            if column == 0: return pdf.name.lower()
-            if column == 1: return pdf.size_kb
-            if column == 2: return pdf.modified_dt
-            if column == 3: return pdf.pages
-            return ""
-
-        self.pdfs.sort(key=sort_key, reverse=reverse)
-            
+
+        if 0 <= column < len(_SORT_KEYS):
+            self.pdfs.sort(key=_SORT_KEYS[column], reverse=reverse)
+
+        # Compare by identity; equal-valued entries must not mask a reorder
+        order_changed = any(a is not b for a, b in zip(self.pdfs, original_order))
+        if order_changed:
+            self._follow_moved_rows(original_order)
+
         if old_state:
             # Commit state if the order changed OR if the sort indicator state changed
-            if (self.pdfs != original_order or 
+            if (order_changed or 
                 old_state.sort_column != self.main_vm.sort_column or
                 old_state.sort_order != self.main_vm.sort_order.value):
                 self.main_vm.commit_state("Sort PDFs", old_state, "PDFListViewModel")
 
         self.layoutChanged.emit()
 
+    def _follow_moved_rows(self, previous_order: List[PDFDocument]):
+        """Point persistent indexes (selection, current index) back at their documents after a reorder."""
+        old_indexes = self.persistentIndexList()
+        if not old_indexes:
+            return
+        new_rows = {id(pdf): row for row, pdf in enumerate(self.pdfs)}
+        new_indexes = [
+            self.index(new_rows[id(previous_order[idx.row()])], idx.column())
+            for idx in old_indexes
+        ]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+
+    def moveRows(self, sourceParent, sourceRow, count, destinationParent, destinationChild):
+        if count <= 0 or sourceRow < 0 or sourceRow + count > len(self.pdfs):
+            return False
+        if not (0 <= destinationChild <= len(self.pdfs)):
+            return False
+        if not self.beginMoveRows(sourceParent, sourceRow, sourceRow + count - 1, destinationParent, destinationChild):
+            return False
+
+        # Move the block in place instead of rebuilding the list from slices
+        moved = self.pdfs[sourceRow:sourceRow + count]
+        del self.pdfs[sourceRow:sourceRow + count]
+        insert_at = destinationChild if destinationChild < sourceRow else destinationChild - count
+        self.pdfs[insert_at:insert_at] = moved
+
+        self.endMoveRows()
+        return True
+
     def supportedDropActions(self):
         return Qt.DropAction.MoveAction
 
     def flags(self, index):
-        default_flags = super().flags(index)
+        # Queried for every painted cell, so the row flags are combined once up front
         if index.isValid():
-            return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsDragEnabled
-        else:
-            return Qt.ItemFlag.ItemIsDropEnabled | default_flags
+            return _ROW_FLAGS
+        return Qt.ItemFlag.ItemIsDropEnabled | super().flags(index)
 
 
 class MainViewModel(QObject):
+    THUMBNAIL_CACHE_MAX_FILES = 16
+    MAX_INCREMENTAL_REMOVE_RUNS = 8
+
     # Signals to update the View
     status_message = Signal(str, int)
     merge_started = Signal()
+    merge_progress = Signal(int, int) # files done, total
     merge_completed = Signal(bool, str)
     output_dir_changed = Signal(str)
     
@@ -359,8 +552,10 @@ class MainViewModel(QObject):
         self.last_open_dir = self.settings.value("last_open_dir", os.path.expanduser("~"), type=str)
         self.worker = None
         self.add_worker = None
+        self._queued_adds = []
+        self.verify_worker = None
         self.thumbnail_worker = None
-        self.thumbnail_cache = {}
+        self.thumbnail_cache = OrderedDict() # file_path -> {page: QImage}, least recently used first
         self._current_preview_file = None
         self._active_workers = [] # Track running threads to prevent crash on destruction
         self.global_toc: List[BookmarkItem] = []
@@ -376,15 +571,20 @@ class MainViewModel(QObject):
         if not self.global_toc:
             return
             
+        # Group bookmarks by their source PDF in one pass (keyed on identity, as
+        # the merge engine does) instead of rescanning the TOC for every PDF and
+        # checking leftovers with list membership, both O(N*B) dataclass comparisons.
+        by_pdf = {id(pdf): [] for pdf in self.pdf_list_model.pdfs}
+        orphans = []
+        for bm in self.global_toc:
+            by_pdf.get(id(bm.source_pdf), orphans).append(bm)
+
         new_global_toc = []
-        for pdf in self.pdf_list_model.pdfs:
-            pdf_bookmarks = [bm for bm in self.global_toc if bm.source_pdf == pdf]
-            new_global_toc.extend(pdf_bookmarks)
+        for bookmarks in by_pdf.values():
+            new_global_toc.extend(bookmarks)
             
         # Add any bookmarks whose PDFs somehow aren't in the list anymore (just in case)
-        for bm in self.global_toc:
-            if bm not in new_global_toc:
-                new_global_toc.append(bm)
+        new_global_toc.extend(orphans)
                 
         self.global_toc = new_global_toc
         self.global_toc_changed.emit()
@@ -425,7 +625,9 @@ class MainViewModel(QObject):
         
         # Cleanup thumbnail cache for files no longer in the list to free memory
         current_paths = {p.file_path for p in self.pdf_list_model.pdfs}
-        self.thumbnail_cache = {path: cache for path, cache in self.thumbnail_cache.items() if path in current_paths}
+        self.thumbnail_cache = OrderedDict(
+            (path, cache) for path, cache in self.thumbnail_cache.items() if path in current_paths
+        )
 
         # Check if current preview is still valid
         if self._current_preview_file:
@@ -531,34 +733,48 @@ class MainViewModel(QObject):
         total_pages_to_show = pdf.pages
         self.thumbnail_started.emit(total_pages_to_show)
         
-        if file_path not in self.thumbnail_cache:
-            self.thumbnail_cache[file_path] = {}
-        else:
+        page_cache = self._thumbnail_page_cache(file_path)
+        if page_cache:
             # Emit all cached thumbnails at once for instant UI update
-            if self.thumbnail_cache[file_path]:
-                self.thumbnail_cache_ready.emit(self.thumbnail_cache[file_path])
+            self.thumbnail_cache_ready.emit(page_cache)
             
-        missing_pages = [p for p in range(total_pages_to_show) if p not in self.thumbnail_cache[file_path]]
+        missing_pages = [p for p in range(total_pages_to_show) if p not in page_cache]
         
         if not missing_pages:
             return
 
         self.thumbnail_worker = ThumbnailWorker(file_path, missing_pages)
         self.thumbnail_worker.thumbnail_ready.connect(self._on_thumbnail_worker_ready)
-        self.thumbnail_worker.finished.connect(self.thumbnail_worker.deleteLater)
+        # Clear the reference before deleteLater: once the sender is destroyed,
+        # its queued calls to Python callables are dropped.
         self.thumbnail_worker.finished.connect(lambda w=self.thumbnail_worker: self._clear_thumbnail_worker_ref(w))
+        self.thumbnail_worker.finished.connect(self.thumbnail_worker.deleteLater)
         self.thumbnail_worker.start(QThread.Priority.LowPriority)
 
+    def _thumbnail_page_cache(self, file_path: str) -> dict:
+        """
+        Return the page -> QImage cache for file_path, marking it most recently used.
+        Only the last THUMBNAIL_CACHE_MAX_FILES files keep their thumbnails, so
+        browsing through a long list does not hold every rendered page in memory.
+        """
+        page_cache = self.thumbnail_cache.get(file_path)
+        if page_cache is None:
+            page_cache = self.thumbnail_cache[file_path] = {}
+            while len(self.thumbnail_cache) > self.THUMBNAIL_CACHE_MAX_FILES:
+                self.thumbnail_cache.popitem(last=False)
+        else:
+            self.thumbnail_cache.move_to_end(file_path)
+        return page_cache
+
     def _on_thumbnail_worker_ready(self, file_path: str, page_num: int, data: object):
-        if file_path not in self.thumbnail_cache:
-            self.thumbnail_cache[file_path] = {}
+        page_cache = self._thumbnail_page_cache(file_path)
         
         if page_num == -1:
             # Batch mode
             batch = data
             batch_to_emit = []
             for p_num, img in batch:
-                self.thumbnail_cache[file_path][p_num] = img
+                page_cache[p_num] = img
                 if file_path == self._current_preview_file:
                     batch_to_emit.append((p_num, img))
             
@@ -566,7 +782,7 @@ class MainViewModel(QObject):
                 self.thumbnail_batch_ready.emit(batch_to_emit)
         else:
             # Single mode (if ever used)
-            self.thumbnail_cache[file_path][page_num] = data
+            page_cache[page_num] = data
             if file_path == self._current_preview_file:
                 self.thumbnail_ready.emit(page_num, data)
 
@@ -581,9 +797,16 @@ class MainViewModel(QObject):
         if self.add_worker == worker:
             self.add_worker = None
 
-    def add_pdfs(self, file_paths: List[str]):
+    def add_pdfs(self, file_paths: List):
+        """Add PDFs in the background. Items may be path strings or os.DirEntry objects."""
         if not file_paths: return
 
+        if self.add_worker is not None and self.add_worker.isRunning():
+            # Abandoning the running add would drop the rest of its files and
+            # its undo entry; run this one after it instead.
+            self._queued_adds.append(file_paths)
+            return
+
         if self.add_worker:
             self._safe_abandon_worker(self.add_worker)
             self.add_worker = None
@@ -591,42 +814,60 @@ class MainViewModel(QObject):
         self._state_before_add = self.get_state()
         self.sort_column = -1
         self.sort_state_changed.emit(-1, Qt.SortOrder.AscendingOrder.value)
-        existing_paths = {pdf.file_path for pdf in self.pdf_list_model.pdfs}
+        existing_paths = {_canonical_path(pdf.file_path) for pdf in self.pdf_list_model.pdfs}
         
         # Move long-running file operations to a background thread
         self.add_worker = AddPDFWorker(file_paths, existing_paths)
         self.add_worker.progress.connect(self._on_pdf_load_progress)
         self.add_worker.load_finished.connect(self._on_pdf_load_finished)
-        self.add_worker.finished.connect(self.add_worker.deleteLater)
         self.add_worker.finished.connect(lambda w=self.add_worker: self._clear_add_worker_ref(w))
+        self.add_worker.finished.connect(self.add_worker.deleteLater)
         
         self.status_message.emit(QCoreApplication.translate("MainViewModel", "Analyzing {0} file(s)...").format(len(file_paths)), 0)
         self.add_worker.start()
 
-    def _on_pdf_load_progress(self, pdf: PDFDocument):
-        # Update model row by row as they are loaded
-        self.pdf_list_model.beginInsertRows(
-            QModelIndex(), 
-            len(self.pdf_list_model.pdfs), 
-            len(self.pdf_list_model.pdfs)
-        )
-        self.pdf_list_model.pdfs.append(pdf)
+    def add_pdf_directory(self, directory: str):
+        """Add every PDF directly inside directory, in name order."""
+        # scandir yields DirEntry objects that carry the directory listing's
+        # file info, which AddPDFWorker reuses instead of stat-ing each path.
+        try:
+            with os.scandir(directory) as it:
+                entries = [e for e in it if e.name.lower().endswith(".pdf") and e.is_file()]
+        except OSError as e:
+            self.status_message.emit(QCoreApplication.translate("MainViewModel", "Error reading folder: {0}").format(e), 5000)
+            self.pdfs_added.emit(0, 0)
+            return
+
+        if not entries:
+            self.status_message.emit(QCoreApplication.translate("MainViewModel", "No PDF files found in {0}.").format(directory), 5000)
+            self.pdfs_added.emit(0, 0)
+            return
+
+        entries.sort(key=lambda e: e.name.lower())
+        self.add_pdfs(entries)
+
+    def _on_pdf_load_progress(self, pdfs: List[PDFDocument]):
+        # Insert the whole batch with a single model notification
+        first = len(self.pdf_list_model.pdfs)
+        self.pdf_list_model.beginInsertRows(QModelIndex(), first, first + len(pdfs) - 1)
+        self.pdf_list_model.pdfs.extend(pdfs)
         self.pdf_list_model.endInsertRows()
         
         # Add to global_toc
-        if pdf.custom_toc:
-            for item in pdf.custom_toc:
-                if len(item) >= 3:
-                    lvl, title, page = item[0], item[1], item[2]
-                    self.global_toc.append(BookmarkItem(title=str(title), page=int(page), level=int(lvl), source_pdf=pdf))
-        else:
-            self.global_toc.append(BookmarkItem(title=os.path.splitext(pdf.name)[0], page=1, level=1, source_pdf=pdf))
+        for pdf in pdfs:
+            if pdf.custom_toc:
+                for item in pdf.custom_toc:
+                    if len(item) >= 3:
+                        lvl, title, page = item[0], item[1], item[2]
+                        self.global_toc.append(BookmarkItem(title=str(title), page=int(page), level=int(lvl), source_pdf=pdf))
+            else:
+                self.global_toc.append(BookmarkItem(title=os.path.splitext(pdf.name)[0], page=1, level=1, source_pdf=pdf))
         
         self.global_toc_changed.emit()
         
-        # If it's the first one, update output dir
-        if len(self.pdf_list_model.pdfs) == 1:
-            self.set_output_dir(os.path.dirname(pdf.file_path))
+        # If these are the first ones, update output dir
+        if first == 0:
+            self.set_output_dir(os.path.dirname(pdfs[0].file_path))
 
     def _on_pdf_load_finished(self, added: int, errors: int):
         if added > 0:
@@ -645,56 +886,60 @@ class MainViewModel(QObject):
             
         self.pdfs_added.emit(added, errors)
 
+        if self._queued_adds:
+            # The finished worker may still be returning from run(); it cleans
+            # itself up, so the next add need not wait for it.
+            self.add_worker = None
+            self.add_pdfs(self._queued_adds.pop(0))
+
     def remove_pdfs_by_indices(self, indices: List[int]):
         old_state = self.get_state()
         self.sort_column = -1
         self.sort_state_changed.emit(-1, Qt.SortOrder.AscendingOrder.value)
         # Sort indices in descending order so removal doesn't shift remaining targets
-        sorted_indices = sorted(indices, reverse=True)
-        removed_pdfs = []
+        pdfs = self.pdf_list_model.pdfs
+        valid_rows = sorted({r for r in indices if 0 <= r < len(pdfs)}, reverse=True)
+        removed_pdf_ids = set()
         removed_any_preview = False
-        for r in sorted_indices:
-            if 0 <= r < len(self.pdf_list_model.pdfs):
-                pdf = self.pdf_list_model.pdfs[r]
-                removed_pdfs.append(pdf)
-                if pdf.file_path == self._current_preview_file:
-                    removed_any_preview = True
-                if pdf.file_path in self.thumbnail_cache:
-                    del self.thumbnail_cache[pdf.file_path]
-                self.pdf_list_model.beginRemoveRows(QModelIndex(), r, r)
-                del self.pdf_list_model.pdfs[r]
+        for r in valid_rows:
+            pdf = pdfs[r]
+            removed_pdf_ids.add(id(pdf))
+            if pdf.file_path == self._current_preview_file:
+                removed_any_preview = True
+            self.thumbnail_cache.pop(pdf.file_path, None)
+
+        runs = _contiguous_runs(valid_rows)
+        if len(runs) > self.MAX_INCREMENTAL_REMOVE_RUNS:
+            # A scattered selection would cost one view update per run; rebuild the list once instead
+            self.pdf_list_model.beginResetModel()
+            pdfs[:] = [pdf for pdf in pdfs if id(pdf) not in removed_pdf_ids]
+            self.pdf_list_model.endResetModel()
+        else:
+            # Remove each contiguous run of rows with a single model notification
+            for first, last in runs:
+                self.pdf_list_model.beginRemoveRows(QModelIndex(), first, last)
+                del pdfs[first:last + 1]
                 self.pdf_list_model.endRemoveRows()
         
         if removed_any_preview:
             self.request_thumbnails(None)
             
-        if removed_pdfs:
-            self.global_toc = [bm for bm in self.global_toc if bm.source_pdf not in removed_pdfs]
+        if removed_pdf_ids:
+            self.global_toc = [bm for bm in self.global_toc if id(bm.source_pdf) not in removed_pdf_ids]
             self.commit_state("Remove PDF(s)", old_state)
             self.global_toc_changed.emit()
         
-        self.status_message.emit(QCoreApplication.translate("MainViewModel", "Removed {0} PDF(s)").format(len(sorted_indices)), 3000)
+        self.status_message.emit(QCoreApplication.translate("MainViewModel", "Removed {0} PDF(s)").format(len(valid_rows)), 3000)
 
     def move_rows(self, source_row: int, count: int, destination_child_row: int):
         # Allow programmatic or drag/drop reordering.
         if destination_child_row >= source_row and destination_child_row <= source_row + count:
             return  # No-op move
 
-        self.pdf_list_model.beginMoveRows(QModelIndex(), source_row, source_row + count - 1, QModelIndex(), destination_child_row)
-        
-        moved_items = self.pdf_list_model.pdfs[source_row : source_row + count]
-        temp_list = self.pdf_list_model.pdfs[:source_row] + self.pdf_list_model.pdfs[source_row + count:]
-        
-        insert_index = destination_child_row
-        if source_row < destination_child_row:
-            insert_index -= count
-            
         old_state = self.get_state()
-        self.sort_column = -1
-        self.pdf_list_model.pdfs = temp_list[:insert_index] + moved_items + temp_list[insert_index:]
-        self.commit_state("Move Row(s)", old_state)
-        
-        self.pdf_list_model.endMoveRows()
+        if self.pdf_list_model.moveRows(QModelIndex(), source_row, count, QModelIndex(), destination_child_row):
+            self.sort_column = -1
+            self.commit_state("Move Row(s)", old_state)
 
     def set_output_dir(self, directory: str):
         if directory and directory != self.output_dir:
@@ -718,9 +963,11 @@ class MainViewModel(QObject):
         self.merge_started.emit()
         self.status_message.emit(QCoreApplication.translate("MainViewModel", "Merging started in background..."), 0)
 
-        # Keep reference to avoid garbage collection
-        self.worker = MergeWorker(list(self.pdf_list_model.pdfs), output_path, self.global_toc)
+        # Keep reference to avoid garbage collection. The worker gets its own
+        # lists, so edits made while it runs cannot resize them under it.
+        self.worker = MergeWorker(list(self.pdf_list_model.pdfs), output_path, list(self.global_toc))
         self.worker.merge_finished.connect(self._on_merge_finished)
+        self.worker.progress.connect(self.merge_progress)
         self.worker.finished.connect(self.worker.deleteLater)
         self.worker.start()
 
@@ -825,6 +1072,7 @@ class MainViewModel(QObject):
             self.pdf_list_model.pdfs.clear()
             self.pdf_list_model.endResetModel()
         self.thumbnail_cache.clear()
+        _read_pdf_metadata.cache_clear()
 
         # Stop any running thumbnail worker
         if self.thumbnail_worker:
@@ -849,13 +1097,6 @@ class MainViewModel(QObject):
         
         self.global_toc_changed.emit()
 
-        # Verify metadata of found files against live disk state
-        metadata_changes = verify_all_pdf_metadata(pdfs)
-        # Refresh the table display after verification updates
-        if metadata_changes:
-            self.pdf_list_model.beginResetModel()
-            self.pdf_list_model.endResetModel()
-
         # Set output dir and name
         self.set_output_dir(result["output_dir"])
 
@@ -866,23 +1107,71 @@ class MainViewModel(QObject):
         # Emit signals
         self.project_loaded.emit(project_path, result["output_name"])
 
-        # Build combined warning message
-        warnings = []
         missing = result.get("missing_files", [])
         if missing:
-            warnings.append(
+            self.project_load_warning.emit(
                 QCoreApplication.translate("MainViewModel", "The following files could not be found:\n")
                 + "\n".join(f"  \u2022 {n}" for n in missing)
                 + QCoreApplication.translate("MainViewModel", "\n\nThey are shown in the list but cannot be merged until relocated or removed.")
             )
+
+        # Verify metadata of found files against live disk state in the background;
+        # the load summary and any changes are reported once it finishes.
+        if self.verify_worker:
+            self._safe_abandon_worker(self.verify_worker)
+            self.verify_worker = None
+        # The values as loaded, so a record re-read while verification runs
+        # (e.g. removed and re-added) is not overwritten by the older result.
+        unverified = {pdf.file_path: (pdf.pages, pdf.size_kb, pdf.modified_dt) for pdf in pdfs}
+        self.verify_worker = VerifyMetadataWorker(pdfs)
+        self.verify_worker.verified.connect(
+            lambda refreshed, changes: self._on_metadata_verified(refreshed, changes, unverified, project_path, missing)
+        )
+        self.verify_worker.finished.connect(lambda w=self.verify_worker: self._clear_verify_worker_ref(w))
+        self.verify_worker.finished.connect(self.verify_worker.deleteLater)
+        self.verify_worker.start()
+
+    def _clear_verify_worker_ref(self, worker):
+        if self.verify_worker == worker:
+            self.verify_worker = None
+
+    def _on_metadata_verified(self, refreshed: List[PDFDocument], metadata_changes: List[str],
+                              unverified: Dict[str, tuple], project_path: str, missing: List[str]):
+        # Edits made while verification ran were snapshotted with the unverified
+        # values, and undo/redo swap those snapshots in as the live list. Records
+        # are matched by path so every copy of a verified file is updated, live
+        # or in the undo history; a record whose metadata no longer matches the
+        # loaded values was re-read since and is left alone.
+        verified = {updated.file_path: updated for updated in refreshed}
+        records = list(self.pdf_list_model.pdfs)
+        for i in range(self.undo_stack.count()):
+            command = self.undo_stack.command(i)
+            if isinstance(command, ProjectStateCommand):
+                records.extend(command.old_state.pdfs)
+                records.extend(command.new_state.pdfs)
+        for pdf in records:
+            updated = verified.get(pdf.file_path)
+            if updated is not None and (pdf.pages, pdf.size_kb, pdf.modified_dt) == unverified.get(pdf.file_path):
+                pdf.pages = updated.pages
+                pdf.size_kb = updated.size_kb
+                pdf.modified_dt = updated.modified_dt
+                pdf.missing = updated.missing
+                pdf.pages_verified = updated.pages_verified
+
+        # Refresh the table display after verification updates
+        if metadata_changes and self.pdf_list_model.pdfs:
+            self.pdf_list_model.dataChanged.emit(
+                self.pdf_list_model.index(0, 0),
+                self.pdf_list_model.index(len(self.pdf_list_model.pdfs) - 1, self.pdf_list_model.columnCount() - 1),
+            )
+
         if metadata_changes:
-            warnings.append(
+            self.project_load_warning.emit(
                 QCoreApplication.translate("MainViewModel", "The following files have changed since the project was saved:\n")
                 + "\n".join(f"  \u2022 {c}" for c in metadata_changes)
             )
 
-        if warnings:
-            self.project_load_warning.emit("\n\n".join(warnings))
+        if missing or metadata_changes:
             self.status_message.emit(
                 QCoreApplication.translate("MainViewModel", "Project loaded with {0} missing, {1} changed file(s).").format(len(missing), len(metadata_changes)), 7000
             )
@@ -118,3 +118,81 @@ def test_merge_pdfs_cross_nested_bookmarks(tmp_path, dummy_pdfs):
     assert result_toc[1][0] == 2 # Level 2
     
     result_doc.close()
+
+def test_merge_pdfs_preserves_order_beyond_prefetch(tmp_path):
+    from engine import PREFETCH_DEPTH
+    output_path = str(tmp_path / "ordered.pdf")
+
+    pdf_docs = []
+    for i in range(PREFETCH_DEPTH + 3):
+        doc = fitz.open()
+        doc.new_page().insert_text(fitz.Point(50, 50), f"Source {i}")
+        path = tmp_path / f"src_{i}.pdf"
+        doc.save(path)
+        doc.close()
+        pdf_docs.append(PDFDocument(
+            file_path=str(path),
+            name=path.name,
+            size_kb=1.0,
+            modified_dt=datetime.now(),
+            pages=1
+        ))
+
+    success, msg = merge_pdfs_engine(pdf_docs, output_path)
+    assert success is True
+
+    result_doc = fitz.open(output_path)
+    texts = [page.get_text().strip() for page in result_doc]
+    result_doc.close()
+    assert texts == [f"Source {i}" for i in range(len(pdf_docs))]
+
+def test_merge_pdfs_repeated_source_opened_once(tmp_path, dummy_pdfs, mocker):
+    output_path = str(tmp_path / "repeated.pdf")
+    first = PDFDocument(file_path=dummy_pdfs[0], name="a.pdf", size_kb=1.0, modified_dt=datetime.now(), pages=2)
+    second = PDFDocument(file_path=dummy_pdfs[1], name="b.pdf", size_kb=1.0, modified_dt=datetime.now(), pages=2)
+    again = PDFDocument(file_path=dummy_pdfs[0], name="a.pdf", size_kb=1.0, modified_dt=datetime.now(), pages=2)
+
+    open_spy = mocker.spy(fitz, "open")
+    insert_spy = mocker.spy(fitz.Document, "insert_pdf")
+    success, msg = merge_pdfs_engine([first, second, again], output_path)
+    assert success is True
+    # Output document plus one open per distinct source
+    assert open_spy.call_count == 3
+    # The graft map of a repeated source is kept until its last insert
+    assert [call.kwargs["final"] for call in insert_spy.call_args_list] == [False, True, True]
+
+    result_doc = fitz.open(output_path)
+    texts = [page.get_text().strip() for page in result_doc]
+    result_doc.close()
+    assert texts == ["PDF 1 Page 1", "PDF 1 Page 2", "PDF 2 Page 1", "PDF 2 Page 2", "PDF 1 Page 1", "PDF 1 Page 2"]
+
+def test_merge_pdfs_reads_each_source_once(tmp_path, dummy_pdfs, mocker):
+    import engine
+    empty_path = tmp_path / "empty.pdf"
+    empty_path.write_bytes(b"%PDF-1.4 fake")
+    empty = PDFDocument(
+        file_path=str(empty_path), name="empty.pdf", size_kb=1.0,
+        modified_dt=datetime.fromtimestamp(empty_path.stat().st_mtime), pages=0, pages_verified=True,
+    )
+    first = PDFDocument(file_path=dummy_pdfs[0], name="a.pdf", size_kb=1.0, modified_dt=datetime.now(), pages=2)
+    again = PDFDocument(file_path=dummy_pdfs[0], name="a.pdf", size_kb=1.0, modified_dt=datetime.now(), pages=2)
+
+    read_spy = mocker.spy(engine, "_read_source_bytes")
+    success, msg = merge_pdfs_engine([first, empty, again, first], str(tmp_path / "out.pdf"))
+    assert success is True
+    # The repeats reuse the open document and the skipped file is never read
+    assert [call.args for call in read_spy.call_args_list] == [(dummy_pdfs[0],)]
+
+def test_merge_pdfs_large_source_opened_by_path(tmp_path, dummy_pdfs, mocker):
+    mocker.patch("engine.PREFETCH_MAX_BYTES", 0)
+    open_spy = mocker.spy(fitz, "open")
+    output_path = str(tmp_path / "large.pdf")
+    pdf_docs = [
+        PDFDocument(file_path=path, name=os.path.basename(path), size_kb=1.0, modified_dt=datetime.now(), pages=2)
+        for path in dummy_pdfs
+    ]
+
+    success, msg = merge_pdfs_engine(pdf_docs, output_path)
+    assert success is True
+    # Sources over the limit are handed to fitz as paths, not prefetched bytes
+    assert [call.args for call in open_spy.call_args_list[1:]] == [(path,) for path in dummy_pdfs]
@@ -68,3 +68,77 @@ def test_engine_fatal_merge_error(mocker):
     success, msg = merge_pdfs_engine(docs, "output.pdf")
     assert success is False
     assert "Merge failed. 1 file(s) had errors." in msg
+
+def test_engine_reports_progress_for_failed_files(mocker):
+    docs = [
+        PDFDocument("a.pdf", "a.pdf", 1.0, datetime.now(), 1),
+        PDFDocument("b.pdf", "b.pdf", 1.0, datetime.now(), 1),
+    ]
+    mock_merged = MagicMock()
+    mock_source = MagicMock()
+    mock_source.page_count = 2
+    mocker.patch("engine.fitz.open", side_effect=[mock_merged, Exception("Simulated read error"), mock_source])
+
+    progress = []
+    success, msg = merge_pdfs_engine(docs, "output.pdf", progress_callback=lambda done, total: progress.append((done, total)))
+    assert success is True
+    assert progress == [(1, 2), (2, 2)]
+
+def test_engine_skips_unchanged_zero_page_file(mocker, tmp_path):
+    path = tmp_path / "empty.pdf"
+    path.write_bytes(b"%PDF-1.4 fake")
+    mtime = datetime.fromtimestamp(path.stat().st_mtime)
+    docs = [PDFDocument(str(path), "empty.pdf", 1.0, mtime, 0, pages_verified=True)]
+    mock_open = mocker.patch("engine.fitz.open", side_effect=[MagicMock()])
+
+    success, msg = merge_pdfs_engine(docs, str(tmp_path / "output.pdf"))
+    assert success is False
+    assert "Merge failed. 1 file(s) had errors." in msg
+    # Only the output document was created; the source was never parsed
+    assert mock_open.call_count == 1
+
+def test_engine_logs_failed_file_without_traceback(mocker, caplog):
+    docs = [PDFDocument("bad.pdf", "bad.pdf", 1.0, datetime.now(), 1)]
+    mocker.patch("engine.fitz.open", side_effect=[MagicMock(), Exception("Simulated read error")])
+
+    with caplog.at_level("WARNING", logger="engine"):
+        merge_pdfs_engine(docs, "output.pdf")
+
+    records = [r for r in caplog.records if r.name == "engine"]
+    assert len(records) == 1
+    assert "bad.pdf" in records[0].getMessage()
+    assert records[0].exc_info is None
+
+def test_engine_closes_source_and_output_after_failed_insert(mocker):
+    docs = [PDFDocument("bad.pdf", "bad.pdf", 1.0, datetime.now(), 1)]
+    mock_merged = MagicMock()
+    mock_merged.insert_pdf.side_effect = RuntimeError("Simulated insert error")
+    mock_source = MagicMock()
+    mock_source.page_count = 1
+    mocker.patch("engine.fitz.open", side_effect=[mock_merged, mock_source])
+
+    success, msg = merge_pdfs_engine(docs, "output.pdf")
+    assert success is False
+    mock_source.close.assert_called_once()
+    mock_merged.close.assert_called_once()
+
+def test_engine_closes_output_when_shared_source_close_fails(mocker):
+    docs = [
+        PDFDocument("a.pdf", "a.pdf", 1.0, datetime.now(), 1),
+        PDFDocument("a.pdf", "a.pdf", 1.0, datetime.now(), 1),
+    ]
+    mock_merged = MagicMock()
+    mock_source = MagicMock()
+    mock_source.page_count = 1
+    mock_source.close.side_effect = RuntimeError("Simulated close error")
+    mocker.patch("engine.fitz.open", side_effect=[mock_merged, mock_source])
+
+    def abort(done, total):
+        # Abort while the repeated source is still held open for reuse
+        raise RuntimeError("Simulated abort")
+
+    success, msg = merge_pdfs_engine(docs, "output.pdf", progress_callback=abort)
+    assert success is False
+    assert "Simulated abort" in msg
+    mock_source.close.assert_called_once()
+    mock_merged.close.assert_called_once()
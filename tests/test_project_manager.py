@@ -78,6 +78,19 @@ def test_roundtrip_custom_toc(sample_pdfs, project_path):
     assert result["pdfs"][2].custom_toc is None
 
 
+def test_roundtrip_global_toc_sources(sample_pdfs, project_path):
+    """Bookmarks keep pointing at the PDF they were attached to."""
+    from model import BookmarkItem
+    global_toc = [
+        BookmarkItem(title="Intro", page=1, level=1, source_pdf=sample_pdfs[2]),
+        BookmarkItem(title="Detail", page=1, level=2, source_pdf=sample_pdfs[0]),
+    ]
+    save_project(project_path, sample_pdfs, "", "out.pdf", global_toc)
+    result = load_project(project_path)
+    loaded = [(bm.title, bm.source_pdf.name) for bm in result["global_toc"]]
+    assert loaded == [("Intro", "doc2.pdf"), ("Detail", "doc0.pdf")]
+
+
 # ---------- Project file format ----------
 
 def test_project_file_is_valid_json(sample_pdfs, project_path):
@@ -219,6 +232,45 @@ def test_refresh_no_changes(real_pdf):
     assert real_pdf.missing is False
 
 
+def test_refresh_unchanged_file_skips_parse(real_pdf, mocker):
+    """An unchanged size and mtime should not reopen the document."""
+    mock_open = mocker.patch("fitz.open")
+    changes = refresh_pdf_metadata(real_pdf)
+    assert changes == []
+    mock_open.assert_not_called()
+
+
+def test_refresh_unchanged_file_rereads_zero_page_count(real_pdf):
+    """A stored count of 0 (e.g. absent from the project) is re-read even if the file is unchanged."""
+    real_pdf.pages = 0
+    changes = refresh_pdf_metadata(real_pdf)
+    assert any("page count changed" in c for c in changes)
+    assert real_pdf.pages == 1
+
+
+def test_merge_loaded_project_without_page_counts(real_pdf, project_path, tmp_path):
+    """An entry saved without "pages" is still merged if it is merged before verification."""
+    import fitz
+    from engine import merge_pdfs_engine
+
+    save_project(project_path, [real_pdf], str(tmp_path), "out.pdf")
+    with open(project_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    del data["pdfs"][0]["pages"]
+    with open(project_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+    loaded = load_project(project_path)["pdfs"]
+    assert loaded[0].pages == 0
+    assert loaded[0].pages_verified is False
+
+    output_path = str(tmp_path / "merged.pdf")
+    success, _ = merge_pdfs_engine(loaded, output_path)
+    assert success is True
+    with fitz.open(output_path) as merged:
+        assert merged.page_count == 1
+
+
 def test_refresh_detects_page_change(real_pdf):
     """If the page count changed on disk, refresh should detect it."""
     import fitz
@@ -218,6 +218,77 @@ def test_undo_redo_bookmark_complex_deletion(qtbot, real_pdf):
     assert it.child(0).child(0).text(0) == "B2"
     assert it.child(0).child(0).child(0).text(0) == "B3"
 
+def test_populate_tree_shape_and_foreign_bookmark_styling(qtbot, real_pdf, tmp_path):
+    import shutil
+    from bookmarks_pane import BookmarksPane
+    other_path = str(tmp_path / "other.pdf")
+    shutil.copy(real_pdf, other_path)
+    vm = MainViewModel()
+    vm.add_pdfs([real_pdf, other_path])
+    qtbot.waitUntil(lambda: len(vm.pdf_list_model.pdfs) == 2, timeout=3000)
+
+    pane = BookmarksPane(vm)
+    pdf_a, pdf_b = vm.pdf_list_model.pdfs
+    removed_pdf = PDFDocument("gone.pdf", "gone.pdf", 1.0, datetime.now(), 1)
+    vm.global_toc = [
+        BookmarkItem("A1", 1, 1, pdf_a),
+        BookmarkItem("Nested B", 1, 2, pdf_b), # nested under A1, so shown under pdf_a's root
+        BookmarkItem("Orphan", 1, 1, removed_pdf), # source no longer in the list
+        BookmarkItem("B1", 1, 1, pdf_b),
+    ]
+    vm.global_toc_changed.emit()
+
+    assert pane.tree.topLevelItemCount() == 2
+    root_a, root_b = pane.tree.topLevelItem(0), pane.tree.topLevelItem(1)
+    assert root_a.data(0, Qt.ItemDataRole.UserRole) is pdf_a
+    assert root_b.data(0, Qt.ItemDataRole.UserRole) is pdf_b
+    assert root_a.childCount() == 1
+    a1 = root_a.child(0)
+    assert a1.text(0) == "A1"
+    assert [root_b.child(i).text(0) for i in range(root_b.childCount())] == ["B1"]
+
+    # A bookmark of pdf_b displayed under pdf_a's root is marked as foreign
+    foreign = a1.child(0)
+    assert foreign.text(0) == "Nested B"
+    assert foreign.font(0).italic() and foreign.font(1).italic()
+    assert foreign.toolTip(0) == f"Source: {pdf_b.name}"
+    assert foreign.icon(0).cacheKey() == pane._bookmark_linked_icon.cacheKey()
+
+    # Bookmarks under their own PDF's root keep the plain style
+    assert not a1.font(0).italic()
+    assert a1.toolTip(0) == ""
+    assert a1.icon(0).cacheKey() == pane._bookmark_icon.cacheKey()
+
+def test_sync_bookmark_chain_deeper_than_recursion_limit(qtbot, real_pdf):
+    import sys
+    from bookmarks_pane import BookmarksPane
+    vm = MainViewModel()
+    vm.add_pdfs([real_pdf])
+    qtbot.waitUntil(lambda: len(vm.pdf_list_model.pdfs) == 1, timeout=3000)
+
+    pane = BookmarksPane(vm)
+    pdf = vm.pdf_list_model.pdfs[0]
+
+    # B1 > B2 > ... each bookmark nested under the previous one
+    depth = sys.getrecursionlimit() + 50
+    vm.global_toc = [BookmarkItem(f"B{level}", 1, level, pdf) for level in range(1, depth + 1)]
+    vm.global_toc_changed.emit()
+    vm.undo_stack.clear()
+
+    # Rename the deepest bookmark in the tree and sync it back
+    item = pane.tree.topLevelItem(0)
+    while item.childCount():
+        item = item.child(0)
+    pane.tree.blockSignals(True)
+    item.setText(0, "Deepest")
+    pane.tree.blockSignals(False)
+    pane._sync_to_viewmodel()
+
+    assert len(vm.global_toc) == depth
+    assert [bm.level for bm in vm.global_toc] == list(range(1, depth + 1))
+    assert [bm.title for bm in vm.global_toc[:-1]] == [f"B{level}" for level in range(1, depth)]
+    assert vm.global_toc[-1].title == "Deepest"
+
 def test_undo_stack_empty_after_load_project(tmp_path):
     # Save a temporary project with a specific output dir
     p1 = tmp_path / "1.pdf"
@@ -76,3 +76,19 @@ def test_adjust_toc_pages_and_levels_no_dict(mocker):
     assert adjusted[1][2] == 15
     assert adjusted[1][3]["kind"] == fitz.LINK_GOTO
     assert adjusted[1][3]["page"] == 14 # 0-based target page
+
+def test_adjust_toc_resolves_names_only_when_needed(mocker):
+    mock_doc = mocker.Mock()
+    mock_doc.resolve_names.return_value = {"intro": {"page": 2}}
+
+    goto_toc = [[1, "Section 1", 1, {"kind": fitz.LINK_GOTO, "page": 0}]]
+    adjust_toc_pages_and_levels(goto_toc, page_offset_0based=5, source_doc=mock_doc)
+    mock_doc.resolve_names.assert_not_called()
+
+    named_toc = [
+        [1, "Intro", 3, {"kind": fitz.LINK_NAMED, "nameddest": "intro"}],
+        [1, "Intro again", 3, {"kind": fitz.LINK_NAMED, "nameddest": "intro"}],
+    ]
+    adjusted = adjust_toc_pages_and_levels(named_toc, page_offset_0based=5, source_doc=mock_doc)
+    assert [item[3]["page"] for item in adjusted] == [7, 7]
+    mock_doc.resolve_names.assert_called_once()
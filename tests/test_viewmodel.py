@@ -79,3 +79,337 @@ def test_main_view_model_move_rows(qtbot):
     assert vm.pdf_list_model.pdfs[1].name == "F2.pdf"
     assert vm.pdf_list_model.pdfs[2].name == "F3.pdf"
     assert vm.pdf_list_model.pdfs[3].name == "F1.pdf"
+
+def test_pdf_list_model_display_and_tooltip():
+    model = PDFListViewModel()
+    from model import PDFDocument
+    from datetime import datetime
+
+    model.pdfs = [PDFDocument("/tmp/a.pdf", "a.pdf", 12.345, datetime(2026, 3, 4, 5, 6, 7), 9)]
+
+    display = [model.data(model.index(0, c)) for c in range(4)]
+    assert display == ["a.pdf", "12.3", "2026-03-04 05:06", "9"]
+
+    tooltips = [model.data(model.index(0, c), Qt.ItemDataRole.ToolTipRole) for c in range(4)]
+    assert tooltips == ["Path: /tmp/a.pdf\nName: a.pdf", "12.345 KB", "2026-03-04 05:06:07", "9 pages"]
+
+def test_read_pdf_metadata_cache_invalidates_on_change(real_pdf):
+    from viewmodel import _read_pdf_metadata
+
+    st = os.stat(real_pdf)
+    pages, _ = _read_pdf_metadata(real_pdf, st.st_mtime_ns, st.st_size)
+    assert pages == 1
+    hits = _read_pdf_metadata.cache_info().hits
+    _read_pdf_metadata(real_pdf, st.st_mtime_ns, st.st_size)
+    assert _read_pdf_metadata.cache_info().hits == hits + 1
+
+    doc = fitz.open()
+    doc.new_page()
+    doc.new_page()
+    doc.save(real_pdf)
+    doc.close()
+
+    st = os.stat(real_pdf)
+    pages, _ = _read_pdf_metadata(real_pdf, st.st_mtime_ns, st.st_size)
+    assert pages == 2
+
+def test_load_project_clears_metadata_cache(qtbot, tmp_path, real_pdf, mocker):
+    from project_manager import save_project
+    from viewmodel import _read_pdf_metadata, VerifyMetadataWorker
+
+    st = os.stat(real_pdf)
+    _read_pdf_metadata(real_pdf, st.st_mtime_ns, st.st_size)
+    assert _read_pdf_metadata.cache_info().currsize > 0
+
+    project_path = str(tmp_path / "project.pdfm")
+    save_project(project_path, [], str(tmp_path), "out.pdf")
+    mocker.patch.object(VerifyMetadataWorker, "start")
+    vm = MainViewModel()
+    vm.do_load_project(project_path)
+    assert _read_pdf_metadata.cache_info().currsize == 0
+
+def test_added_pdf_toc_is_project_serializable(qtbot, tmp_path):
+    import json
+    path = tmp_path / "with_toc.pdf"
+    doc = fitz.open()
+    doc.new_page()
+    doc.new_page()
+    doc.set_toc([[1, "Intro", 1], [2, "Details", 2]])
+    doc.save(str(path))
+    doc.close()
+
+    vm = MainViewModel()
+    vm.add_pdfs([str(path)])
+    qtbot.waitUntil(lambda: len(vm.pdf_list_model.pdfs) == 1, timeout=3000)
+
+    toc = vm.pdf_list_model.pdfs[0].custom_toc
+    assert toc == [[1, "Intro", 1], [2, "Details", 2]]
+    json.dumps(toc)
+
+def test_add_pdfs_skips_duplicate_spellings(qtbot, real_pdf):
+    vm = MainViewModel()
+    alias = os.path.join(os.path.dirname(real_pdf), ".", os.path.basename(real_pdf))
+
+    finished = []
+    vm.pdfs_added.connect(lambda added, errors: finished.append((added, errors)))
+    vm.add_pdfs([real_pdf, alias, real_pdf])
+    qtbot.waitUntil(lambda: len(finished) == 1, timeout=3000)
+
+    assert finished == [(1, 0)]
+    assert len(vm.pdf_list_model.pdfs) == 1
+
+def test_remove_pdfs_by_indices_contiguous_runs(qtbot):
+    vm = MainViewModel()
+    from model import PDFDocument
+    from datetime import datetime
+
+    vm.pdf_list_model.pdfs = [
+        PDFDocument(f"p{i}", f"F{i}.pdf", 1.0, datetime.now(), 1)
+        for i in range(6)
+    ]
+
+    removals = []
+    vm.pdf_list_model.rowsRemoved.connect(lambda parent, first, last: removals.append((first, last)))
+    vm.remove_pdfs_by_indices([1, 2, 4, 5])
+
+    assert [p.name for p in vm.pdf_list_model.pdfs] == ["F0.pdf", "F3.pdf"]
+    assert removals == [(4, 5), (1, 2)]
+
+def test_remove_pdfs_by_indices_scattered_resets_once(qtbot):
+    vm = MainViewModel()
+    from model import PDFDocument
+    from datetime import datetime
+
+    vm.pdf_list_model.pdfs = [
+        PDFDocument(f"p{i}", f"F{i}.pdf", 1.0, datetime.now(), 1)
+        for i in range(40)
+    ]
+
+    removals = []
+    resets = []
+    vm.pdf_list_model.rowsRemoved.connect(lambda parent, first, last: removals.append((first, last)))
+    vm.pdf_list_model.modelReset.connect(lambda: resets.append(True))
+    vm.remove_pdfs_by_indices(list(range(0, 40, 2)))
+
+    assert [p.name for p in vm.pdf_list_model.pdfs] == [f"F{i}.pdf" for i in range(1, 40, 2)]
+    assert removals == []
+    assert resets == [True]
+
+def test_main_view_model_move_rows_up(qtbot):
+    vm = MainViewModel()
+    from model import PDFDocument
+    from datetime import datetime
+
+    vm.pdf_list_model.pdfs = [
+        PDFDocument(f"p{i}", f"F{i}.pdf", 1.0, datetime.now(), 1)
+        for i in range(5)
+    ]
+
+    # Move F3, F4 to the top
+    vm.move_rows(3, 2, 0)
+    assert [p.name for p in vm.pdf_list_model.pdfs] == ["F3.pdf", "F4.pdf", "F0.pdf", "F1.pdf", "F2.pdf"]
+
+def test_add_pdf_directory(qtbot, tmp_path):
+    for name in ["b.pdf", "A.PDF"]:
+        doc = fitz.open()
+        doc.new_page()
+        doc.save(str(tmp_path / name))
+        doc.close()
+    (tmp_path / "notes.txt").write_text("not a pdf")
+    (tmp_path / "sub.pdf").mkdir()
+
+    vm = MainViewModel()
+    vm.add_pdf_directory(str(tmp_path))
+    qtbot.waitUntil(lambda: len(vm.pdf_list_model.pdfs) == 2, timeout=3000)
+
+    assert [p.name for p in vm.pdf_list_model.pdfs] == ["A.PDF", "b.pdf"]
+    assert all(isinstance(p.file_path, str) for p in vm.pdf_list_model.pdfs)
+
+def test_add_pdf_directory_without_pdfs(qtbot, tmp_path):
+    vm = MainViewModel()
+    with qtbot.waitSignal(vm.pdfs_added, timeout=1000) as blocker:
+        vm.add_pdf_directory(str(tmp_path))
+    assert blocker.args == [0, 0]
+    assert len(vm.pdf_list_model.pdfs) == 0
+
+def test_thumbnail_cache_evicts_least_recently_used(qtbot):
+    vm = MainViewModel()
+    limit = vm.THUMBNAIL_CACHE_MAX_FILES
+
+    for i in range(limit):
+        vm._on_thumbnail_worker_ready(f"f{i}.pdf", -1, [(0, f"img{i}")])
+    # Touch the oldest entry so the next insert evicts f1 instead
+    vm._thumbnail_page_cache("f0.pdf")
+    vm._on_thumbnail_worker_ready("new.pdf", -1, [(0, "img")])
+
+    assert len(vm.thumbnail_cache) == limit
+    assert "f0.pdf" in vm.thumbnail_cache
+    assert "f1.pdf" not in vm.thumbnail_cache
+    assert vm.thumbnail_cache["new.pdf"] == {0: "img"}
+
+def test_load_project_verifies_metadata_in_background(qtbot, tmp_path, real_pdf):
+    from datetime import datetime
+    from project_manager import save_project
+    from model import PDFDocument
+
+    stale = PDFDocument(real_pdf, "dummy_for_vm.pdf", 0.5, datetime(2020, 1, 1), 7)
+    project_path = str(tmp_path / "project.pdfm")
+    save_project(project_path, [stale], str(tmp_path), "out.pdf")
+
+    vm = MainViewModel()
+    with qtbot.waitSignal(vm.project_load_warning, timeout=3000) as blocker:
+        vm.do_load_project(project_path)
+
+    assert "changed since the project was saved" in blocker.args[0]
+    loaded = vm.pdf_list_model.pdfs[0]
+    assert loaded.pages == 1
+    assert loaded.size_kb == os.path.getsize(real_pdf) / 1024.0
+
+def test_edits_during_verification_keep_verified_metadata(qtbot, tmp_path, real_pdf):
+    from datetime import datetime
+    from project_manager import save_project
+    from model import PDFDocument
+
+    stale = PDFDocument(real_pdf, "dummy_for_vm.pdf", 0.5, datetime(2020, 1, 1), 7)
+    project_path = str(tmp_path / "project.pdfm")
+    save_project(project_path, [stale], str(tmp_path), "out.pdf")
+
+    vm = MainViewModel()
+    with qtbot.waitSignal(vm.project_load_warning, timeout=3000):
+        vm.do_load_project(project_path)
+        # Snapshotted before the verification result is delivered
+        vm.remove_pdfs_by_indices([0])
+        vm.undo_stack.undo()
+
+    assert vm.pdf_list_model.pdfs[0].pages == 1
+    vm.undo_stack.redo()
+    vm.undo_stack.undo()
+    restored = vm.pdf_list_model.pdfs[0]
+    assert restored.pages == 1
+    assert restored.size_kb == os.path.getsize(real_pdf) / 1024.0
+
+def test_readded_file_keeps_fresh_metadata_after_verification(qtbot, tmp_path, real_pdf, mocker):
+    from datetime import datetime
+    from project_manager import save_project, verify_all_pdf_metadata
+    from model import PDFDocument
+    from viewmodel import VerifyMetadataWorker
+
+    stale = PDFDocument(real_pdf, "dummy_for_vm.pdf", 0.5, datetime(2020, 1, 1), 7)
+    project_path = str(tmp_path / "project.pdfm")
+    save_project(project_path, [stale], str(tmp_path), "out.pdf")
+
+    # Run verification by hand so its result can be delivered late
+    mocker.patch.object(VerifyMetadataWorker, "start")
+    vm = MainViewModel()
+    vm.do_load_project(project_path)
+    worker = vm.verify_worker
+    changes = verify_all_pdf_metadata(worker.pdfs)
+    assert worker.pdfs[0].pages == 1
+
+    # The file gains a page and is removed and re-added before the result arrives
+    doc = fitz.open()
+    doc.new_page()
+    doc.new_page()
+    doc.save(real_pdf)
+    doc.close()
+    vm.remove_pdfs_by_indices([0])
+    vm.add_pdfs([real_pdf])
+    qtbot.waitUntil(lambda: len(vm.pdf_list_model.pdfs) == 1, timeout=3000)
+
+    worker.verified.emit(worker.pdfs, changes)
+    assert vm.pdf_list_model.pdfs[0].pages == 2
+    # The removed record in the undo history still gets the verified values
+    vm.undo_stack.undo()
+    vm.undo_stack.undo()
+    assert vm.pdf_list_model.pdfs[0].pages == 1
+
+def test_missing_files_warned_before_verification(qtbot, tmp_path, real_pdf, mocker):
+    from datetime import datetime
+    from project_manager import save_project
+    from model import PDFDocument
+    from viewmodel import VerifyMetadataWorker
+
+    gone = PDFDocument(str(tmp_path / "gone.pdf"), "gone.pdf", 1.0, datetime(2020, 1, 1), 1)
+    project_path = str(tmp_path / "project.pdfm")
+    save_project(project_path, [gone], str(tmp_path), "out.pdf")
+
+    mocker.patch.object(VerifyMetadataWorker, "start")
+    vm = MainViewModel()
+    warnings = []
+    vm.project_load_warning.connect(warnings.append)
+    vm.do_load_project(project_path)
+
+    assert len(warnings) == 1
+    assert "gone.pdf" in warnings[0]
+
+def test_sort_reorders_global_toc_by_pdf(qtbot):
+    from datetime import datetime
+    from model import PDFDocument, BookmarkItem
+    vm = MainViewModel()
+    b = PDFDocument("b", "b.pdf", 1.0, datetime.now(), 1)
+    a = PDFDocument("a", "a.pdf", 1.0, datetime.now(), 1)
+    orphan_pdf = PDFDocument("gone", "gone.pdf", 1.0, datetime.now(), 1)
+    vm.pdf_list_model.pdfs = [b, a]
+    vm.global_toc = [
+        BookmarkItem("B1", 1, 1, b),
+        BookmarkItem("Orphan", 1, 1, orphan_pdf),
+        BookmarkItem("A1", 1, 1, a),
+        BookmarkItem("B2", 1, 2, b),
+    ]
+
+    vm.pdf_list_model.sort(0, Qt.SortOrder.AscendingOrder)
+    assert [bm.title for bm in vm.global_toc] == ["A1", "B1", "B2", "Orphan"]
+
+def test_sort_keeps_persistent_indexes_on_same_pdf(qtbot):
+    from datetime import datetime
+    from PySide6.QtCore import QPersistentModelIndex
+    from model import PDFDocument
+    vm = MainViewModel()
+    vm.pdf_list_model.pdfs = [
+        PDFDocument(name, f"{name}.pdf", 1.0, datetime.now(), 1)
+        for name in ("c", "a", "b")
+    ]
+    tracked = QPersistentModelIndex(vm.pdf_list_model.index(0, 0))
+
+    vm.pdf_list_model.sort(0, Qt.SortOrder.AscendingOrder)
+    assert [p.file_path for p in vm.pdf_list_model.pdfs] == ["a", "b", "c"]
+    assert tracked.row() == 2
+
+def test_add_worker_emits_first_pdf_immediately(real_pdf, tmp_path, mocker):
+    import shutil
+    from viewmodel import AddPDFWorker
+    paths = [real_pdf]
+    for i in range(3):
+        copy_path = tmp_path / f"copy{i}.pdf"
+        shutil.copy(real_pdf, copy_path)
+        paths.append(str(copy_path))
+
+    mocker.patch.object(AddPDFWorker, "BATCH_INTERVAL", 60)
+    worker = AddPDFWorker(paths, set())
+    batches = []
+    worker.progress.connect(lambda pdfs: batches.append(len(pdfs)))
+    worker.run()
+
+    assert batches == [1, 3]
+
+def test_add_during_running_add_keeps_both_batches(qtbot, real_pdf, tmp_path):
+    import shutil
+    paths = []
+    for i in range(5):
+        copy_path = tmp_path / f"batch{i}.pdf"
+        shutil.copy(real_pdf, copy_path)
+        paths.append(str(copy_path))
+
+    vm = MainViewModel()
+    finished = []
+    vm.pdfs_added.connect(lambda added, errors: finished.append(added))
+    vm.add_pdfs(paths[:3])
+    assert vm.add_worker.isRunning()
+    vm.add_pdfs(paths[3:] + [paths[0]])
+
+    qtbot.waitUntil(lambda: len(finished) == 2, timeout=5000)
+    assert finished == [3, 2]
+    assert [p.file_path for p in vm.pdf_list_model.pdfs] == paths
+    # Each batch keeps its own undo entry
+    texts = [vm.undo_stack.text(i) for i in range(vm.undo_stack.count())]
+    assert texts.count("Add PDF(s)") == 2
@@ -76,6 +76,21 @@ def test_merge_worker_exception(qtbot, mocker):
     assert blocker.args[0] is False
     assert "Simulated worker error" in blocker.args[1]
 
+def test_merge_worker_throttles_progress(mocker):
+    worker = MergeWorker([], "output.pdf", [])
+    emitted = []
+    worker.progress.connect(lambda done, total: emitted.append((done, total)))
+
+    def fake_engine(pdf_list, output_path, global_toc, progress_callback):
+        for done in range(1, 101):
+            progress_callback(done, 100)
+        return True, "ok"
+    mocker.patch("viewmodel.merge_pdfs_engine", side_effect=fake_engine)
+
+    worker.run()
+    # A burst of files collapses to the first report plus the final one
+    assert emitted == [(1, 100), (100, 100)]
+
 def test_pdf_list_model_data_invalid_role():
     model = PDFListViewModel()
     model.pdfs = [PDFDocument("dummy.pdf", "dummy.pdf", 1.0, datetime.now(), 1)]
@@ -107,3 +122,26 @@ def test_main_view_model_slots(qtbot, mocker):
     with qtbot.waitSignal(vm.status_message, timeout=1000) as blocker:
         vm._on_merge_finished(False, "Error!")
     assert "Error!" in blocker.args[0]
+
+def test_pdf_list_model_drop_reorders_selection():
+    model = PDFListViewModel()
+    model.pdfs = [PDFDocument(f"p{i}", f"F{i}.pdf", 1.0, datetime.now(), 1) for i in range(5)]
+
+    # Drag F0 and F2 to just before F4
+    mime = model.mimeData([model.index(0, 0), model.index(2, 0)])
+    model.dropMimeData(mime, Qt.DropAction.MoveAction, 4, 0, QModelIndex())
+
+    assert [p.name for p in model.pdfs] == ["F1.pdf", "F3.pdf", "F0.pdf", "F2.pdf", "F4.pdf"]
+
+def test_pdf_list_model_drop_keeps_persistent_indexes():
+    from PySide6.QtCore import QPersistentModelIndex
+    model = PDFListViewModel()
+    model.pdfs = [PDFDocument(f"p{i}", f"F{i}.pdf", 1.0, datetime.now(), 1) for i in range(5)]
+    dragged = QPersistentModelIndex(model.index(0, 0))
+    bystander = QPersistentModelIndex(model.index(3, 1))
+
+    mime = model.mimeData([model.index(0, 0), model.index(2, 0)])
+    model.dropMimeData(mime, Qt.DropAction.MoveAction, 4, 0, QModelIndex())
+
+    assert (dragged.row(), dragged.column()) == (2, 0)
+    assert (bystander.row(), bystander.column()) == (1, 1)
@@ -288,6 +288,16 @@ De vises i listen, men kan ikke slås sammen før de er flyttet eller fjernet.</
         <source>Project loaded: {0}</source>
         <translation>Prosjekt lastet: {0}</translation>
     </message>
+    <message>
+        <location filename="../source/viewmodel.py" line="732"/>
+        <source>Error reading folder: {0}</source>
+        <translation>Feil ved lesing av mappe: {0}</translation>
+    </message>
+    <message>
+        <location filename="../source/viewmodel.py" line="737"/>
+        <source>No PDF files found in {0}.</source>
+        <translation>Fant ingen PDF-filer i {0}.</translation>
+    </message>
 </context>
 <context>
     <name>MainWindow</name>
@@ -617,6 +627,16 @@ Continue?</source>
         <translation>Å åpne et prosjekt vil erstatte den gjeldende PDF-listen.
 Fortsette?</translation>
     </message>
+    <message>
+        <location filename="../source/view.py" line="282"/>
+        <source> Add Folder</source>
+        <translation> Legg til mappe</translation>
+    </message>
+    <message>
+        <location filename="../source/view.py" line="687"/>
+        <source>Select Folder</source>
+        <translation>Velg mappe</translation>
+    </message>
 </context>
 <context>
     <name>PDFListViewModel</name>
@@ -688,16 +708,6 @@ Sti: {0}</translation>
         <source>No PDFs to merge.</source>
         <translation>Ingen PDF-er å slå sammen.</translation>
     </message>
-    <message>
-        <location filename="../source/engine.py" line="34"/>
-        <source>{0} (no pages)</source>
-        <translation>{0} (ingen sider)</translation>
-    </message>
-    <message>
-        <location filename="../source/engine.py" line="53"/>
-        <source>{0} ({1})</source>
-        <translation>{0} ({1})</translation>
-    </message>
     <message>
         <location filename="../source/engine.py" line="81"/>
         <source>Merged {0} PDF(s) to {1}</source>